@@ -6,16 +6,22 @@ import re
 import uuid
 from decimal import Decimal
 
+_RE_UPPER = re.compile(r"[A-Z]")
+_RE_LOWER = re.compile(r"[a-z]")
+_RE_DIGIT = re.compile(r"\d")
+_RE_FULL_NAME = re.compile(r'^[a-zA-Z\s\-\.]+$')
+_RE_MAPPING_NAME = re.compile(r'^[a-zA-Z0-9_\-\s]+$')
+
 # Custom validators
 def validate_password_strength(password: str) -> str:
     """Validate password strength"""
     if len(password) < 8:
         raise ValueError("Password must be at least 8 characters long")
-    if not re.search(r"[A-Z]", password):
+    if not _RE_UPPER.search(password):
         raise ValueError("Password must contain at least one uppercase letter")
-    if not re.search(r"[a-z]", password):
+    if not _RE_LOWER.search(password):
         raise ValueError("Password must contain at least one lowercase letter")
-    if not re.search(r"\d", password):
+    if not _RE_DIGIT.search(password):
         raise ValueError("Password must contain at least one digit")
     return password
 
@@ -81,7 +87,7 @@ class UserRegister(BaseModel):
     
     @validator('full_name')
     def validate_full_name(cls, v):
-        if not re.match(r'^[a-zA-Z\s\-\.]+$', v):
+        if not _RE_FULL_NAME.match(v):
             raise ValueError("Full name can only contain letters, spaces, hyphens, and periods")
         return v.strip()
 
@@ -132,7 +138,7 @@ class ColumnMappingCreate(BaseModel):
     
     @validator('mapping_name')
     def validate_mapping_name(cls, v):
-        if not re.match(r'^[a-zA-Z0-9_\-\s]+$', v):
+        if not _RE_MAPPING_NAME.match(v):
             raise ValueError("Mapping name can only contain letters, numbers, spaces, hyphens, and underscores")
         return v.strip()
 
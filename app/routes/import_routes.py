@@ -10,7 +10,7 @@ from app.monitoring import live_monitor
 from app.erp_integration import erp_integration
 from app.utils.file_processor import process_excel_file, process_csv_file, validate_file_extension
 from app.utils.mapping_engine import mapping_engine
-from app.utils.validators import validate_business_rules
+from app.utils.validators import validate_business_rules_batch
 
 router = APIRouter()
 
@@ -118,23 +118,33 @@ async def process_import_file(job_id: str, file: UploadFile, mapping: Dict[str,
             "failed": 0
         })
         
-        # Apply mapping
-        mapped_data = mapping_engine.apply_mapping(df, {
+        # Apply mapping; uploads can be large enough to be worth worker processes.
+        # The mapped frame keeps df's index, so rows can be traced back to the file
+        mapping_result = mapping_engine.apply_mapping(df, {
             "target_columns": mapping["target_columns"],
             "mapping_rules": mapping.get("mapping_rules", {})
-        })
+        }, records=False, parallel=True)
+        mapped_frame = mapping_result["mapped_data"]
+        mapped_data = mapped_frame.to_dict('records')
         
-        # Validate data
+        # Validate data; rows the mapping rejected are already failures
         valid_data = []
-        errors = []
+        errors = [
+            {
+                "row": error["row_index"] + 2,  # +2 for header row and 1-based indexing
+                "data": error["original_data"],
+                "errors": error["errors"]
+            }
+            for error in mapping_result["validation_errors"]
+        ]
         
-        for i, row in enumerate(mapped_data):
-            validation = validate_business_rules(row, mapping.get("mapping_rules", {}))
+        validations = validate_business_rules_batch(mapped_data, mapping.get("mapping_rules", {}))
+        for i, (row_index, row, validation) in enumerate(zip(mapped_frame.index, mapped_data, validations)):
             if validation["is_valid"]:
                 valid_data.append(validation["validated_data"])
             else:
                 errors.append({
-                    "row": i + 2,  # +2 for header row and 1-based indexing
+                    "row": row_index + 2,
                     "data": row,
                     "errors": validation["errors"]
                 })
@@ -149,11 +159,13 @@ async def process_import_file(job_id: str, file: UploadFile, mapping: Dict[str,
                 })
                 
                 await live_monitor.update_job_progress(job_id, {
-                    "total": len(mapped_data),
+                    "total": len(df),
                     "processed": len(valid_data),
                     "failed": len(errors)
                 })
         
+        errors.sort(key=lambda error: error["row"])
+        
         # Send valid data to ERP
         erp_result = {"success": False, "message": "ERP integration not configured"}
         
@@ -171,7 +183,7 @@ async def process_import_file(job_id: str, file: UploadFile, mapping: Dict[str,
         
         # Final job update
         final_status = "completed" if len(valid_data) > 0 else "failed"
-        if len(errors) == len(mapped_data):  # All records failed
+        if len(errors) == len(df):  # All records failed
             final_status = "failed"
         
         await supabase.update_job_status(job_id, {
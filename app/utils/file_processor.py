@@ -12,6 +12,8 @@ from .models import ERPNextEndpoint, ERPNextCustomerCreate, ERPNextItemCreate, E
 
 logger = logging.getLogger(__name__)
 
+_RE_NUMBER = re.compile(r'\d+\.?\d*')
+
 class FileType(Enum):
     EXCEL = "excel"
     CSV = "csv"
@@ -120,8 +122,8 @@ class ERPNextDataMapper:
             return value.strip()
         elif transformation == 'numeric' and isinstance(value, str):
             # Extract numbers from string
-            numbers = re.findall(r'\d+\.?\d*', value)
-            return float(numbers[0]) if numbers else 0
+            number = _RE_NUMBER.search(value)
+            return float(number.group()) if number else 0
         elif transformation == 'date':
             # Convert to YYYY-MM-DD format
             try:
@@ -565,9 +567,11 @@ class FileProcessor:
         """
         try:
             erp_data = []
+            columns = list(df.columns)
             
-            for _, row in df.iterrows():
-                row_dict = row.to_dict()
+            # Plain tuples instead of a Series per row, which also keeps each column's dtype
+            for row_tuple in df.itertuples(index=False, name=None):
+                row_dict = dict(zip(columns, row_tuple))
                 
                 # Map based on endpoint type
                 if endpoint == ERPNextEndpoint.CUSTOMERS:
@@ -623,16 +627,18 @@ class FileProcessor:
         """
         erp_data = []
         target_mapping = mapping_config.get('target_columns', {})
+        positions = {name: i for i, name in enumerate(df.columns)}
         
-        for _, row in df.iterrows():
+        for row_tuple in df.itertuples(index=False, name=None):
             erp_record = {}
             
             for target_field, source_config in target_mapping.items():
                 source_field = source_config.get('source_column')
                 transformation = source_config.get('transformation')
                 
-                if source_field in df.columns:
-                    value = row[source_field]
+                position = positions.get(source_field)
+                if position is not None:
+                    value = row_tuple[position]
                     
                     # Apply transformations if specified
                     if transformation == 'uppercase' and isinstance(value, str):
@@ -0,0 +1,58 @@
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional, fall back to plain NumPy
+    NUMBA_AVAILABLE = False
+
+# Bits set by numeric_range_flags
+RANGE_BELOW_MIN = 1
+RANGE_ABOVE_MAX = 2
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _round_clip_nonneg_jit(arr, decimals):
+        out = np.empty_like(arr)
+        for i in prange(arr.size):
+            v = arr[i]
+            out[i] = round(v, decimals) if v > 0 else 0.0
+        return out
+
+    @njit(cache=True, parallel=True)
+    def _numeric_range_flags_jit(arr, min_value, max_value, check_min, check_max):
+        out = np.zeros(arr.size, np.uint8)
+        for i in prange(arr.size):
+            v = arr[i]
+            flags = 0
+            if check_min and v < min_value:
+                flags |= RANGE_BELOW_MIN
+            if check_max and v > max_value:
+                flags |= RANGE_ABOVE_MAX
+            out[i] = flags
+        return out
+
+def round_clip_nonneg(arr: np.ndarray, decimals: int = 2) -> np.ndarray:
+    """Round a float64 array to ``decimals`` places, clipping negatives and NaN to 0"""
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _round_clip_nonneg_jit(arr, decimals)
+    return np.round(np.where(arr > 0, arr, 0.0), decimals)
+
+def numeric_range_flags(arr: np.ndarray, min_value: float = None, max_value: float = None) -> np.ndarray:
+    """Flag values outside [min_value, max_value] with RANGE_* bits; NaN is never flagged"""
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
+    check_min, check_max = min_value is not None, max_value is not None
+    min_value = float(min_value) if check_min else 0.0
+    max_value = float(max_value) if check_max else 0.0
+    if NUMBA_AVAILABLE:
+        return _numeric_range_flags_jit(arr, min_value, max_value, check_min, check_max)
+    out = np.zeros(arr.size, np.uint8)
+    if check_min:
+        out |= np.where(arr < min_value, RANGE_BELOW_MIN, 0).astype(np.uint8)
+    if check_max:
+        out |= np.where(arr > max_value, RANGE_ABOVE_MAX, 0).astype(np.uint8)
+    return out
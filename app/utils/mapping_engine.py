@@ -1,17 +1,887 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Callable, Union
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Callable, Union
+from types import MappingProxyType
+import os
 import re
+import copy
+import pickle
+import math
 import logging
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, wraps
+from itertools import repeat
 from datetime import datetime, date
 from decimal import Decimal, InvalidOperation
-import json
 from enum import Enum
 
 from .models import ERPNextEndpoint
+from .kernels import round_clip_nonneg, numeric_range_flags, RANGE_BELOW_MIN, RANGE_ABOVE_MAX
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used by the per-cell transformations
+_RE_WS = re.compile(r'\s+')
+_RE_NON_ALNUM_SPACE = re.compile(r'[^a-zA-Z0-9\s]')
+_RE_EMAIL = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_RE_PHONE_STRIP = re.compile(r'[^\d+]')
+_RE_PHONE = re.compile(r'[\d\s\-+()]+')
+_ISO_FAST = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_NUM_RE = re.compile(r'^-?\d+(\.\d+)?$')
+# Every character Python's \s matches, for patterns run by Arrow's regex engine
+# (RE2's \s is ASCII only). Kept unescaped: whitespace is literal inside a class.
+_WS_CHARS = ''.join(c for c in map(chr, range(0x3001)) if c.isspace())
+
+# Formats tried by _format_date_iso, in their initial order
+_DATE_FORMATS = (
+    '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d',
+    '%m-%d-%Y', '%d-%m-%Y', '%Y.%m.%d', '%d.%m.%Y',
+    '%b %d, %Y', '%B %d, %Y', '%d %b %Y', '%d %B %Y'
+)
+
+# Below this many rows the thread pool overhead outweighs running columns in parallel
+_PARALLEL_MIN_ROWS = 10_000
+
+# ERPNext transformations relevant to each endpoint; company and warehouse apply everywhere
+_GENERAL_ERPNEXT_TRANSFORMATIONS = frozenset({"erpnext_company", "erpnext_warehouse"})
+_CUSTOMER_TRANSFORMATIONS = frozenset({"erpnext_customer_code", "erpnext_customer_name", "erpnext_territory"})
+_ITEM_TRANSFORMATIONS = frozenset({"erpnext_item_code", "erpnext_item_name", "erpnext_item_group", "erpnext_uom"})
+_SALES_TRANSFORMATIONS = _CUSTOMER_TRANSFORMATIONS | _ITEM_TRANSFORMATIONS | {"erpnext_quantity", "erpnext_rate"}
+_ENDPOINT_TRANSFORMATIONS: Dict[ERPNextEndpoint, frozenset] = {
+    ERPNextEndpoint.CUSTOMERS: _CUSTOMER_TRANSFORMATIONS,
+    ERPNextEndpoint.ITEMS: _ITEM_TRANSFORMATIONS,
+    ERPNextEndpoint.SALES_ORDERS: _SALES_TRANSFORMATIONS,
+    ERPNextEndpoint.SALES_INVOICES: _SALES_TRANSFORMATIONS,
+    ERPNextEndpoint.PAYMENTS: _CUSTOMER_TRANSFORMATIONS | {"erpnext_payment_type"},
+    ERPNextEndpoint.BINS: frozenset({"erpnext_item_code", "erpnext_quantity", "erpnext_uom"}),
+}
+
+# Per-row failures included in the summary log line of a batch
+_ERROR_LOG_SAMPLES = 20
+
+# apply_mapping splits frames larger than this across worker processes
+_PROCESS_MIN_ROWS = 50_000
+
+# Workers are forked from a clean server process with this module preloaded: forking
+# the caller directly hangs once numba's parallel kernels have started their threads
+if "forkserver" in multiprocessing.get_all_start_methods():
+    _PROCESS_CONTEXT = multiprocessing.get_context("forkserver")
+    _PROCESS_CONTEXT.set_forkserver_preload([__name__])
+else:
+    _PROCESS_CONTEXT = multiprocessing.get_context("spawn")
+
+# Rule keys the compiled numeric range kernel covers on its own
+_NUMERIC_KERNEL_RULES = frozenset({"data_type", "required", "min_value", "max_value"})
+
+# String source columns with fewer distinct values than this share of rows are dictionary-encoded
+_CATEGORY_MAX_RATIO = 0.5
+
+# Successful date parses between re-sorts of the format list by hit count
+_DATE_RESORT_INTERVAL = 1000
+
+# Translation tables deleting every ASCII character not allowed in ERPNext codes;
+# non-ASCII characters are dropped by an ASCII encode before translating
+_ASCII_ALNUM = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
+_CUST_CODE_DELETE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if chr(c) not in _ASCII_ALNUM and chr(c) not in '_-'
+))
+_ITEM_CODE_DELETE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if chr(c) not in _ASCII_ALNUM and chr(c) != '-'
+))
+
+@lru_cache(maxsize=32)
+def _special_chars_pattern(allowed_chars: str) -> re.Pattern:
+    """Compile (and cache) the special character pattern for the given allowed characters"""
+    return re.compile(f'[^a-zA-Z0-9\\s{re.escape(allowed_chars)}]')
+
+@lru_cache(maxsize=256)
+def _rule_pattern(pattern: str) -> re.Pattern:
+    """Compile (and cache) a regex taken from validation rules"""
+    return re.compile(pattern)
+
+def _remove_special_chars_vec(series: pd.Series, allowed_chars: str = "") -> pd.Series:
+    """Column kernel for MappingEngine._remove_special_chars"""
+    pattern = f'[^a-zA-Z0-9{_WS_CHARS}{re.escape(allowed_chars)}]'
+    return _as_str(series).str.replace(pattern, '', regex=True)
+
+@lru_cache(maxsize=4096)
+def _is_parseable_date(value: str) -> bool:
+    """Whether pd.to_datetime accepts the string, cached because dates repeat heavily"""
+    # Coercing avoids building a traceback for every unparseable value
+    return value in _NAT_STRINGS or not pd.isna(pd.to_datetime(value, errors='coerce'))
+
+# ERPNext value normalization tables, keyed by lowercase input
+_TERRITORY_MAP = {
+    "burma": "Myanmar",
+    "myanmar (burma)": "Myanmar",
+    "mm": "Myanmar",
+    "mmr": "Myanmar"
+}
+
+_GROUP_MAP = {
+    "product": "Products",
+    "goods": "Products",
+    "material": "Products",
+    "service": "Services",
+    "raw material": "Raw Materials"
+}
+
+_UOM_MAP = {
+    "piece": "Nos",
+    "pieces": "Nos",
+    "unit": "Nos",
+    "units": "Nos",
+    "kilogram": "Kg",
+    "kilograms": "Kg",
+    "gram": "Gram",
+    "grams": "Gram",
+    "meter": "Meter",
+    "meters": "Meter"
+}
+
+_PAYMENT_MAP = {
+    "payment": "Pay",
+    "receipt": "Receive",
+    "income": "Receive",
+    "expense": "Pay",
+    "in": "Receive",
+    "out": "Pay"
+}
+
+# Pure per-value transformations worth memoizing: imports repeat the same
+# codes, territories and phones across many rows (dates are cached by
+# _parse_date_text, as _format_date_iso also counts format hits, and emails by
+# _normalize_email_text, keyed by the engine's strict_email flag)
+_MEMOIZED_TRANSFORMS = (
+    "_format_erpnext_customer_code",
+    "_format_erpnext_territory",
+    "_format_phone_international",
+)
+_MEMO_MAXSIZE = 8192
+_HASHABLE_SCALARS = (str, int, float, bool, type(None))
+
+@lru_cache(maxsize=_MEMO_MAXSIZE)
+def _parse_date_text(text: str, formats: tuple) -> tuple:
+    """ISO 8601 text of a stripped date string and the first of ``formats`` that parses it, if any"""
+    for fmt in formats:
+        try:
+            date_obj = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        return date_obj.date().isoformat(), fmt
+    return text, None
+
+@lru_cache(maxsize=_MEMO_MAXSIZE)
+def _normalize_email_text(email: str, strict: bool) -> str:
+    """The lowercased, stripped address if it passes the strict or structural check, else an empty string"""
+    if strict:
+        return email if _RE_EMAIL.fullmatch(email) else ""
+    at = email.rfind('@')
+    if at < 1 or email.find('.', at) < 0 or ' ' in email:
+        return ""
+    return email
+
+def _memoized(fn: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap a pure single-argument transformation in an LRU cache for scalar inputs"""
+    cached = lru_cache(maxsize=_MEMO_MAXSIZE, typed=True)(fn)
+    
+    @wraps(fn)
+    def wrapper(value: Any) -> Any:
+        # NaN never equals itself, so distinct NaN objects would only fill the cache
+        if isinstance(value, _HASHABLE_SCALARS) and value == value:
+            return cached(value)
+        return fn(value)
+    
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+# Compiled runners, validation plans and config checks kept per engine
+_SPEC_CACHE_SIZE = 128
+
+def _fingerprint(value: Any) -> Any:
+    """Hashable key for a JSON-like spec that keeps types and key order
+    
+    Unlike ``json.dumps(..., sort_keys=True, default=str)``, ``{1: "a"}`` and
+    ``{"1": "a"}`` get different keys, as do 1, 1.0 and True, and keys of mixed
+    types need no sorting.
+    """
+    if isinstance(value, Mapping):
+        return (dict, tuple((_fingerprint(key), _fingerprint(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_fingerprint(item) for item in value))
+    if isinstance(value, (str, int, type(None))):
+        return (type(value), value)
+    # repr tells 0.0 from -0.0 and gives unhashable values a key
+    return (type(value), repr(value))
+
+class _SpecCache:
+    """Thread-safe LRU mapping of spec fingerprints to what was built for them"""
+    
+    def __init__(self, maxsize: int = _SPEC_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def __setitem__(self, key: Any, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+def _factorize_exact(series: pd.Series) -> tuple:
+    """pd.factorize, except that values only share a code when str() also tells them apart
+    
+    Plain factorize merges 1, 1.0 and True, and 0.0 with -0.0. Those columns
+    are keyed by type and repr instead; missing values still get code -1.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind == "f":
+            values = series.to_numpy()
+            if not (np.signbit(values) & (values == 0)).any():
+                return pd.factorize(series)
+        elif dtype != object or pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty"):
+            return pd.factorize(series)
+    elif not isinstance(dtype, pd.CategoricalDtype) or pd.api.types.infer_dtype(dtype.categories) == "string":
+        return pd.factorize(series)
+    
+    missing = series.isna().to_numpy(dtype=bool)
+    codes = np.full(len(series), -1, dtype=np.intp)
+    index: Dict[tuple, int] = {}
+    uniques: List[Any] = []
+    for position, value in enumerate(series.to_numpy(dtype=object)):
+        if missing[position]:
+            continue
+        key = (type(value), value) if type(value) in (str, int, bool) else (type(value), repr(value))
+        code = index.get(key)
+        if code is None:
+            code = index[key] = len(uniques)
+            uniques.append(value)
+        codes[position] = code
+    return codes, uniques
+
+def _map_unique(series: pd.Series, fn: Callable[[Any], Any]) -> pd.Series:
+    """Apply a scalar transformation once per distinct value and broadcast the results"""
+    codes, uniques = _factorize_exact(series)
+    results = np.empty(len(uniques) + 1, dtype=object)
+    results[:-1] = [fn(value) for value in uniques]
+    mapped = results[codes]
+    # Code -1 lumps None, NaN and NA together, so those go through fn one type at a time
+    missing = codes == -1
+    if missing.any():
+        by_type: Dict[type, Any] = {}
+        for position, value in zip(np.flatnonzero(missing), series.to_numpy(dtype=object)[missing]):
+            if type(value) not in by_type:
+                by_type[type(value)] = fn(value)
+            mapped[position] = by_type[type(value)]
+    return pd.Series(mapped, index=series.index, dtype=object)
+
+def _redo_cells(result: pd.Series, source: pd.Series, redo: np.ndarray, missing: np.ndarray,
+                name: str, fn: Callable[..., Any], params: Dict[str, Any], errors: List[tuple]) -> pd.Series:
+    """Recompute the ``redo`` cells of a kernel result with the scalar transformation
+    
+    Missing values are computed once per type and strings once per value. As
+    in row mode, a call that raises leaves the cell at its input value and is
+    recorded in ``errors`` as (row_index, transformation, message).
+    """
+    positions = np.flatnonzero(redo)
+    if not len(positions):
+        return result
+    values = source.to_numpy(dtype=object)
+    out = result.to_numpy(dtype=object, copy=True)
+    memo: Dict[Any, tuple] = {}
+    failed = False
+    for position in positions:
+        value = values[position]
+        key = type(value) if missing[position] else (value if type(value) is str else None)
+        outcome = memo.get(key) if key is not None else None
+        if outcome is None:
+            try:
+                outcome = (True, fn(value, **params))
+            except Exception as e:
+                outcome = (False, str(e))
+            if key is not None:
+                memo[key] = outcome
+        succeeded, redone = outcome
+        if not succeeded:
+            errors.append((source.index[position], name, redone))
+            redone = value
+            failed = True
+        out[position] = redone
+    
+    patched = pd.Series(out, index=result.index, dtype=object)
+    # Inputs kept by failed cells must not recast the computed values (say, ints to float)
+    if failed or not (isinstance(result.dtype, np.dtype) and result.dtype.kind in "biuf"):
+        return patched
+    inferred = patched.infer_objects()
+    # Keep storage narrowed by _downcast when the redone values fit it
+    if inferred.dtype != result.dtype and inferred.dtype.kind == result.dtype.kind and result.dtype.kind in "iuf":
+        narrowed = inferred.astype(result.dtype)
+        if np.array_equal(narrowed.to_numpy(dtype=np.float64), inferred.to_numpy(dtype=np.float64), equal_nan=True):
+            return narrowed
+    return inferred
+
+def _run_kernel(name: str, kernel: Callable[..., Any], source: pd.Series, fn: Callable[..., Any],
+                params: Dict[str, Any], errors: List[tuple]) -> pd.Series:
+    """Run a column kernel and redo its missing cells with the scalar transformation ``fn``
+    
+    A kernel returns the transformed column, or ``(column, flagged)`` when it
+    leaves some non-missing values (say, text pd.to_numeric cannot parse) to
+    ``fn`` as well.
+    """
+    result = kernel(source, **params)
+    missing = source.isna().to_numpy(dtype=bool)
+    if isinstance(result, tuple):
+        result, flagged = result
+        return _redo_cells(result, source, flagged | missing, missing, name, fn, params, errors)
+    return _redo_cells(result, source, missing, missing, name, fn, params, errors)
+
+# Column-level (vectorized) transformation kernels
+try:
+    import pyarrow  # noqa: F401
+    # Arrow-backed strings run the .str kernels in C++ with a compact layout
+    _STRING_DTYPE = pd.StringDtype("pyarrow")
+except ImportError:
+    _STRING_DTYPE = pd.StringDtype("python")
+
+def _as_str(series: pd.Series) -> pd.Series:
+    """Cast a column to strings as ``str()`` does, with None as the empty string
+    
+    This is what the scalar string transformations see, so NaN becomes
+    ``"nan"`` rather than disappearing.
+    """
+    if series.dtype == _STRING_DTYPE and not series.hasnans:
+        return series
+    missing = series.isna().to_numpy(dtype=bool)
+    if missing.any():
+        # Filled as objects: list assignment into an Arrow-backed column fails
+        values = series.to_numpy(dtype=object, copy=True)
+        values[missing] = ["" if value is None else str(value) for value in values[missing]]
+        series = pd.Series(values, index=series.index, name=series.name)
+    return series.astype(_STRING_DTYPE)
+
+def _is_falsy_vec(series: pd.Series) -> pd.Series:
+    """Vectorized ``not value`` check, also treating missing values as empty"""
+    return series.isna() | ~series.astype(object).astype(bool)
+
+def _is_empty_value(value: Any) -> bool:
+    """Emptiness test of the ``empty``/``not_empty`` conditional operators"""
+    return not value or str(value).strip() == ""
+
+def _empty_mask_vec(series: pd.Series, empty: bool = True) -> np.ndarray:
+    """Vectorized ``empty`` (or ``not_empty``) condition over a column
+    
+    Missing values are checked with _is_empty_value once per type, so NaN
+    counts as the non-empty text ``'nan'`` just like it does row by row; a
+    value the scalar test raises on matches neither operator.
+    """
+    missing = series.isna().to_numpy(dtype=bool)
+    result = np.zeros(len(series), dtype=bool)
+    present = series[~missing]
+    blank = (~present.astype(object).astype(bool) | (_as_str(present).str.strip() == "")).to_numpy(dtype=bool)
+    result[~missing] = blank if empty else ~blank
+    if missing.any():
+        memo = {}
+        positions = np.flatnonzero(missing)
+        for position, value in zip(positions, series.to_numpy(dtype=object)[positions]):
+            if type(value) not in memo:
+                try:
+                    memo[type(value)] = _is_empty_value(value) == empty
+                except Exception:
+                    memo[type(value)] = False
+            result[position] = memo[type(value)]
+    return result
+
+def _object_scalar(value: Any) -> np.ndarray:
+    """Wrap any value in a 0-d object array so np.where keeps it as-is"""
+    wrapped = np.empty((), dtype=object)
+    wrapped[()] = value
+    return wrapped
+
+def _to_numeric_vec(series: pd.Series) -> np.ndarray:
+    """Coerce a column to a float64 buffer as float() would, NaN where a value is not numeric"""
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+        return series.to_numpy(dtype=np.float64)
+    objects = series.to_numpy(dtype=object)
+    values = np.asarray(pd.to_numeric(objects, errors='coerce'), dtype=np.float64)
+    # pd.to_numeric only finds the numbers: its string parser is not correctly
+    # rounded, so the text is converted again by float() (via the object cast)
+    parsed = ~np.isnan(values)
+    try:
+        values[parsed] = objects[parsed].astype(np.float64)
+    except (ValueError, TypeError, OverflowError):
+        values[parsed] = [_float_or_nan(value) for value in objects[parsed]]
+    return values
+
+def _float_or_nan(value: Any) -> float:
+    """float(value), or NaN when float() rejects it"""
+    try:
+        return float(value)
+    except (ValueError, TypeError, OverflowError):
+        return np.nan
+
+def _float_vec(series: pd.Series) -> np.ndarray:
+    """float() over a column, NaN where it raises
+    
+    Cells pd.to_numeric rejects are retried one by one, since float() also
+    accepts text such as ``'1_000'``.
+    """
+    values = _to_numeric_vec(series)
+    retry = np.isnan(values)
+    if retry.any():
+        values[retry] = [_float_or_nan(value) for value in series.to_numpy(dtype=object)[retry]]
+    return values
+
+def _downcast(values: pd.Series, dtype: Optional[str]) -> pd.Series:
+    """Narrow a numeric column to ``dtype``
+    
+    "float", "integer", "signed" and "unsigned" pick the smallest type that
+    holds every value; anything else is passed to ``astype``.
+    """
+    if dtype is None:
+        return values
+    if dtype in ("float", "integer", "signed", "unsigned"):
+        return pd.to_numeric(values, downcast=dtype)
+    return values.astype(dtype, copy=False)
+
+def _round_half_cells(values: np.ndarray, decimals: int) -> np.ndarray:
+    """Cells where ``np.round(values, decimals)`` may differ from Python's round()
+    
+    NumPy scales, rounds and scales back, so a product that lands within
+    rounding error of .5 can round the other way than the correctly rounded
+    round(); so can products too large to hold as exact integers.
+    """
+    if not 0 <= decimals <= 15:
+        return np.ones(len(values), dtype=bool)
+    with np.errstate(invalid='ignore', over='ignore'):
+        scaled = values * 10.0 ** decimals
+        near_half = np.abs(scaled - np.floor(scaled) - 0.5) <= np.abs(scaled) * 2.0 ** -52 + 1e-9
+        return near_half | ~(np.abs(scaled) < 2.0 ** 52)
+
+def _to_float_vec(series: pd.Series, dtype: Optional[str] = None) -> tuple:
+    """Column kernel for MappingEngine._to_float; values pd.to_numeric cannot parse are flagged"""
+    values = _to_numeric_vec(series)
+    return _downcast(pd.Series(values, index=series.index), dtype), np.isnan(values)
+
+def _to_integer_vec(series: pd.Series, dtype: Optional[str] = None) -> tuple:
+    """Column kernel for MappingEngine._to_integer; non-finite and out of int64 range values are flagged"""
+    values = _to_numeric_vec(series)
+    fits = np.abs(values) < 2.0 ** 63
+    integers = np.where(fits, values, 0.0).astype(np.int64)
+    return _downcast(pd.Series(integers, index=series.index), dtype), ~fits
+
+def _round_decimal_vec(series: pd.Series, decimals: int = 2) -> tuple:
+    """Column kernel for MappingEngine._round_decimal; see _round_half_cells for the flagged values"""
+    values = _to_numeric_vec(series)
+    return pd.Series(np.round(values, decimals), index=series.index), _round_half_cells(values, decimals)
+
+def _to_percentage_vec(series: pd.Series) -> tuple:
+    """Column kernel for MappingEngine._to_percentage; values pd.to_numeric cannot parse are flagged"""
+    values = _to_numeric_vec(series)
+    return pd.Series(values * 100.0, index=series.index), np.isnan(values)
+
+def _format_currency_vec(series: pd.Series) -> tuple:
+    """Column kernel for MappingEngine._format_currency; only the formatting runs per value
+    
+    Values pd.to_numeric cannot parse are flagged, as float() still reads
+    some of them (``'nan'``, ``'1_000'``).
+    """
+    values = _to_numeric_vec(series)
+    unparsed = np.isnan(values)
+    amounts = np.where(unparsed, 0.0, values)
+    return pd.Series([f"${amount:,.2f}" for amount in amounts.tolist()], index=series.index, dtype=object), unparsed
+
+def _to_scaled_vec(series: pd.Series, precision: int = 2) -> tuple:
+    """Convert amounts to int64 units of 10**-precision so downstream arithmetic stays in integers
+    
+    Amounts whose scaled value falls outside int64 are flagged rather than
+    wrapped around, so the scalar conversion reports them as errors; so is
+    text pd.to_numeric cannot parse.
+    """
+    values = _to_numeric_vec(series)
+    scaled = np.rint(np.where(np.isfinite(values), values, 0.0) * 10 ** precision)
+    fits = np.abs(scaled) < 2.0 ** 63
+    return pd.Series(np.where(fits, scaled, 0.0).astype(np.int64), index=series.index), ~fits | np.isnan(values)
+
+def _to_cents_vec(series: pd.Series) -> tuple:
+    """Convert currency amounts to int64 cents"""
+    return _to_scaled_vec(series, 2)
+
+def _scaled_to_decimal(values: Any, precision: int = 2) -> List[Decimal]:
+    """Convert scaled int64 values back to Decimals at the serialization boundary"""
+    return [Decimal(int(value)).scaleb(-precision) for value in values]
+
+_TRUE_TOKENS = frozenset({'true', 'yes', 'y', '1', 'on', 't'})
+_YES_TOKENS = frozenset({'yes', 'y', 'true'})
+# Types MappingEngine._to_boolean converts with bool() instead of by token
+_TRUTHY_TYPES = frozenset({bool, int, float, np.float64})
+
+def _to_boolean_vec(series: pd.Series) -> pd.Series:
+    """Column kernel for MappingEngine._to_boolean"""
+    values = series.astype(object)
+    numeric = values.map(type).isin(_TRUTHY_TYPES).to_numpy(dtype=bool)
+    by_token = _as_str(series).str.lower().str.strip().isin(_TRUE_TOKENS).to_numpy(dtype=bool)
+    by_value = values.where(numeric, False).astype(bool).to_numpy()
+    return pd.Series(np.where(numeric, by_value, by_token), index=series.index)
+
+def _yes_no_to_boolean_vec(series: pd.Series) -> pd.Series:
+    """Column kernel for MappingEngine._yes_no_to_boolean"""
+    return _as_str(series).str.lower().str.strip().isin(_YES_TOKENS).astype(bool)
+
+# Marks keys missing from a lookup table, whose values may be None
+_NOT_FOUND = object()
+
+def _lookup_value_vec(series: pd.Series, lookup_table: Dict, default: Any = None) -> pd.Series:
+    """Column kernel for MappingEngine._lookup_value"""
+    codes, uniques = pd.factorize(series.astype(str).str.strip())
+    # Looked up as objects once per key: Series.map turns None into NaN and ints into floats
+    looked_up = np.fromiter((lookup_table.get(key, _NOT_FOUND) for key in uniques), dtype=object, count=len(uniques))
+    hits = np.fromiter((value is not _NOT_FOUND for value in looked_up), dtype=bool, count=len(uniques))
+    found = hits[codes] & series.notna().to_numpy()
+    return pd.Series(np.where(found, looked_up[codes], _object_scalar(default)), index=series.index, dtype=object)
+
+def _format_erpnext_quantity_vec(series: pd.Series, dtype: Optional[str] = None) -> tuple:
+    """Column kernel for MappingEngine._format_erpnext_quantity; values pd.to_numeric cannot parse are flagged"""
+    values = _to_numeric_vec(series)
+    return _downcast(pd.Series(np.maximum(values, 0.0), index=series.index), dtype), np.isnan(values)
+
+def _format_erpnext_rate_vec(series: pd.Series) -> tuple:
+    """Column kernel for MappingEngine._format_erpnext_rate; see _round_half_cells for the flagged values"""
+    values = _to_numeric_vec(series)
+    return pd.Series(round_clip_nonneg(values, 2), index=series.index), _round_half_cells(values, 2)
+
+def _to_decimal_vec(series: pd.Series, precision: int = 2) -> tuple:
+    """Column kernel for MappingEngine._to_decimal
+    
+    The numeric check runs as one vector pass; only finite values go through
+    the Decimal constructor, which still reads the original text so no
+    precision is lost to float conversion. The rest are flagged.
+    """
+    quantum = Decimal('1.' + '0' * precision)
+    zero = Decimal('0.00')
+    valid = np.isfinite(_to_numeric_vec(series))
+    values = []
+    for value, is_valid in zip(series.tolist(), valid):
+        if is_valid:
+            try:
+                values.append(Decimal(str(value)).quantize(quantum))
+                continue
+            except (InvalidOperation, ValueError, TypeError):
+                pass
+        values.append(zero)
+    return pd.Series(values, index=series.index, dtype=object), ~valid
+
+# Parse every value on its own, as the scalar date check does. pandas 2 infers one
+# format from the first value unless told format="mixed"; pandas 1.x only does
+# that with infer_datetime_format=True, so it is left out there (values in other
+# formats would become NaT)
+_MIXED_DATE_KWARGS = {"format": "mixed"} if int(pd.__version__.split(".")[0]) >= 2 else {}
+
+def _parse_dates(series: pd.Series) -> pd.Series:
+    """Parse a column into datetime64 values, unparseable entries become NaT"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    # cache=True parses each distinct string once, which pays off on repetitive ERP dates
+    return pd.to_datetime(_as_str(series), errors='coerce', cache=True, **_MIXED_DATE_KWARGS)
+
+def _iso_to_format(iso: str, raw: Any, fmt: str) -> str:
+    """Reformat an ISO date from MappingEngine._parse_date, or return the raw value's text"""
+    if iso and len(iso) >= 10:
+        try:
+            return datetime.strptime(iso[:10], '%Y-%m-%d').strftime(fmt)
+        except ValueError:
+            pass
+    return str(raw)
+
+def _iso_part(iso: str, start: int, stop: int) -> int:
+    """Date component at ``iso[start:stop]``, 0 when the ISO date is too short or not numeric"""
+    if iso and len(iso) >= stop:
+        try:
+            return int(iso[start:stop])
+        except ValueError:
+            pass
+    return 0
+
+def _erpnext_lookup_vec(table: Dict[str, str], default: str, passthrough: bool = True) -> Callable[[pd.Series], pd.Series]:
+    """Build a kernel normalizing a column through an ERPNext lookup table
+    
+    Values are stripped and title-cased, then mapped by their lowercase form.
+    Unmapped values are kept as-is (or replaced by ``default`` when
+    ``passthrough`` is False) and empty values get ``default``.
+    """
+    def kernel(series: pd.Series) -> pd.Series:
+        raw = _as_str(series)
+        titled = raw.str.strip().str.title()
+        mapped = titled.str.lower().map(table)
+        mapped = mapped.fillna(titled) if passthrough else mapped.fillna(default)
+        return mapped.where(~_is_falsy_vec(series), default)
+    return kernel
+
+# Kernels only have to match their scalar transformation on the values they do
+# not flag: _run_kernel redoes missing and flagged cells with the scalar function,
+# so every value comes out the same whether a chain runs per column or per row
+VECTOR_OPS: Dict[str, Callable[..., pd.Series]] = {
+    "uppercase": lambda s: _as_str(s).str.upper(),
+    "lowercase": lambda s: _as_str(s).str.lower(),
+    "title_case": lambda s: _as_str(s).str.title(),
+    "trim": lambda s: _as_str(s).str.strip(),
+    "remove_extra_spaces": lambda s: _as_str(s).str.strip().str.replace(f'[{_WS_CHARS}]+', ' ', regex=True),
+    "keep_alphanumeric": lambda s: _as_str(s).str.replace(f'[^a-zA-Z0-9{_WS_CHARS}]', '', regex=True),
+    "remove_special_chars": _remove_special_chars_vec,
+    "to_float": _to_float_vec,
+    "to_integer": _to_integer_vec,
+    "to_decimal": _to_decimal_vec,
+    "round_decimal": _round_decimal_vec,
+    "to_fixed_cents": _to_cents_vec,
+    "to_scaled_integer": _to_scaled_vec,
+    "percentage": _to_percentage_vec,
+    "currency_format": _format_currency_vec,
+    "to_boolean": _to_boolean_vec,
+    "yes_no_to_boolean": _yes_no_to_boolean_vec,
+    "lookup": _lookup_value_vec,
+    "erpnext_quantity": _format_erpnext_quantity_vec,
+    "erpnext_rate": _format_erpnext_rate_vec,
+    "erpnext_territory": _erpnext_lookup_vec(_TERRITORY_MAP, "Myanmar"),
+    "erpnext_item_group": _erpnext_lookup_vec(_GROUP_MAP, "Products"),
+    "erpnext_uom": _erpnext_lookup_vec(_UOM_MAP, "Nos"),
+    "erpnext_payment_type": _erpnext_lookup_vec(_PAYMENT_MAP, "Receive", passthrough=False),
+}
+
+# Date transformations as functions of the ISO date from MappingEngine._parse_date
+# and the raw value; the scalar methods and the column path (which parses each
+# distinct value once) share them
+DATE_VECTOR_OPS: Dict[str, Callable[[str, Any], Any]] = {
+    "date_iso": lambda iso, raw: iso,
+    "date_us": lambda iso, raw: _iso_to_format(iso, raw, '%m/%d/%Y'),
+    "date_european": lambda iso, raw: _iso_to_format(iso, raw, '%d/%m/%Y'),
+    "extract_year": lambda iso, raw: _iso_part(iso, 0, 4),
+    "extract_month": lambda iso, raw: _iso_part(iso, 5, 7),
+    "extract_day": lambda iso, raw: _iso_part(iso, 8, 10),
+}
+
+# Python types accepted by the scalar checks in MappingEngine._validate_data_type
+_STRING_TYPES = frozenset({str, np.str_})
+_NUMERIC_TYPES = frozenset({int, float, bool, np.float64})
+_EPOCH_TYPES = frozenset({int, float, np.float64, np.float32, np.int64, np.int32})
+_NAT_STRINGS = ["", "NaT", "nat", "NAT", "nan", "NaN", "NAN"]
+_BOOL_STRINGS = frozenset({'true', 'false', 'yes', 'no', '1', '0'})
+
+def _is_string_value(value: Any) -> bool:
+    return isinstance(value, str) or value is None
+
+def _is_numeric_value(value: Any) -> bool:
+    return isinstance(value, (int, float)) or (isinstance(value, str) and _NUM_RE.match(value) is not None)
+
+def _is_date_value(value: Any) -> bool:
+    if isinstance(value, (datetime, date)):
+        return True
+    if isinstance(value, str):
+        return _is_parseable_date(value)
+    # Numbers are accepted as epoch offsets, anything else has to parse
+    if value is None or type(value) in _EPOCH_TYPES:
+        return True
+    return not pd.isna(pd.to_datetime(value, errors='coerce'))
+
+def _is_boolean_value(value: Any) -> bool:
+    return isinstance(value, bool) or str(value).lower() in _BOOL_STRINGS
+
+def _is_email_value(value: Any) -> bool:
+    return isinstance(value, str) and _RE_EMAIL.fullmatch(value) is not None
+
+def _is_phone_value(value: Any) -> bool:
+    return _RE_PHONE.fullmatch(str(value)) is not None
+
+# Scalar checks behind MappingEngine._validate_data_type, by data_type rule
+_DATA_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": _is_string_value,
+    "numeric": _is_numeric_value,
+    "date": _is_date_value,
+    "boolean": _is_boolean_value,
+    "email": _is_email_value,
+    "phone": _is_phone_value,
+}
+
+# Data types decided by one regex (fullmatch) over the string values of a column
+_DATA_TYPE_PATTERNS: Dict[str, re.Pattern] = {
+    "email": _RE_EMAIL,
+    "phone": _RE_PHONE,
+}
+
+# Whitelists checked by MappingEngine.validate_mapping_config
+_VALID_ENDPOINTS = frozenset(endpoint.value for endpoint in ERPNextEndpoint)
+_VALID_DATA_TYPES = frozenset(_DATA_TYPE_CHECKS)
+# Transformations that do nothing useful without parameters
+_PARAMETERIZED_TRANSFORMS = frozenset({"concat", "conditional", "lookup"})
+
+# Templates returned by MappingEngine.generate_sample_mapping, keyed by data type
+_SAMPLE_MAPPINGS: Dict[str, Dict[str, Any]] = {
+    "customers": {
+        "mapping_name": "Sample Customer Import",
+        "description": "Customer master data for ERPNext",
+        "erp_endpoint": ERPNextEndpoint.CUSTOMERS.value,
+        "source_columns": [
+            {"source_column": "Customer Code", "target_field": "customer_code", "data_type": "string", "required": True},
+            {"source_column": "Customer Name", "target_field": "customer_name", "data_type": "string", "required": True},
+            {"source_column": "Email", "target_field": "email_id", "data_type": "email", "required": False},
+            {"source_column": "Phone", "target_field": "mobile_no", "data_type": "phone", "required": False},
+            {"source_column": "Territory", "target_field": "territory", "data_type": "string", "required": False},
+        ],
+        "target_columns": {
+            "customer_code": {"source_column": "Customer Code",
+                              "transformations": [{"name": "erpnext_customer_code"}]},
+            "customer_name": {"source_column": "Customer Name",
+                              "transformations": [{"name": "erpnext_customer_name"}]},
+            "email_id": {"source_column": "Email", "transformations": [{"name": "email_normalize"}]},
+            "mobile_no": {"source_column": "Phone", "transformations": [{"name": "phone_international"}]},
+            "territory": {"source_column": "Territory", "transformations": [{"name": "erpnext_territory"}]},
+        },
+        "validation_rules": {
+            "customer_code": {"required": True},
+            "customer_name": {"required": True},
+            "email_id": {"data_type": "email"},
+        },
+    },
+    "items": {
+        "mapping_name": "Sample Item Import",
+        "description": "Item master data for ERPNext",
+        "erp_endpoint": ERPNextEndpoint.ITEMS.value,
+        "source_columns": [
+            {"source_column": "Item Code", "target_field": "item_code", "data_type": "string", "required": True},
+            {"source_column": "Item Name", "target_field": "item_name", "data_type": "string", "required": True},
+            {"source_column": "Category", "target_field": "item_group", "data_type": "string", "required": False},
+            {"source_column": "Unit", "target_field": "stock_uom", "data_type": "string", "required": False},
+            {"source_column": "Price", "target_field": "standard_rate", "data_type": "numeric", "required": False},
+        ],
+        "target_columns": {
+            "item_code": {"source_column": "Item Code", "transformations": [{"name": "erpnext_item_code"}]},
+            "item_name": {"source_column": "Item Name", "transformations": [{"name": "erpnext_item_name"}]},
+            "item_group": {"source_column": "Category", "transformations": [{"name": "erpnext_item_group"}]},
+            "stock_uom": {"source_column": "Unit", "transformations": [{"name": "erpnext_uom"}]},
+            "standard_rate": {"source_column": "Price", "transformations": [{"name": "erpnext_rate"}]},
+        },
+        "validation_rules": {
+            "item_code": {"required": True},
+            "item_name": {"required": True},
+            "standard_rate": {"data_type": "numeric", "min_value": 0},
+        },
+    },
+    "sales_orders": {
+        "mapping_name": "Sample Sales Order Import",
+        "description": "Sales order lines for ERPNext",
+        "erp_endpoint": ERPNextEndpoint.SALES_ORDERS.value,
+        "source_columns": [
+            {"source_column": "Customer", "target_field": "customer", "data_type": "string", "required": True},
+            {"source_column": "Delivery Date", "target_field": "delivery_date", "data_type": "date", "required": True},
+            {"source_column": "Item Code", "target_field": "item_code", "data_type": "string", "required": True},
+            {"source_column": "Qty", "target_field": "qty", "data_type": "numeric", "required": True},
+            {"source_column": "Rate", "target_field": "rate", "data_type": "numeric", "required": True},
+        ],
+        "target_columns": {
+            "customer": {"source_column": "Customer", "transformations": [{"name": "erpnext_customer_code"}]},
+            "delivery_date": {"source_column": "Delivery Date", "transformations": [{"name": "date_iso"}]},
+            "item_code": {"source_column": "Item Code", "transformations": [{"name": "erpnext_item_code"}]},
+            "qty": {"source_column": "Qty", "transformations": [{"name": "erpnext_quantity"}]},
+            "rate": {"source_column": "Rate", "transformations": [{"name": "erpnext_rate"}]},
+        },
+        "validation_rules": {
+            "customer": {"required": True},
+            "delivery_date": {"required": True, "data_type": "date"},
+            "qty": {"data_type": "numeric", "min_value": 0},
+            "rate": {"data_type": "numeric", "min_value": 0},
+        },
+    },
+}
+
+def _transform_names(mapping: Dict[str, Any]) -> Iterator[str]:
+    """Names of a mapping's transformation chain, each looked up once"""
+    return (t.get("name") for t in mapping.get("transformations", []))
+
+def _data_type_mask(series: pd.Series, expected_type: str) -> np.ndarray:
+    """Column kernel for MappingEngine._validate_data_type for a whole column"""
+    if expected_type == "boolean":
+        return _as_str(series).str.lower().isin(_BOOL_STRINGS).to_numpy(dtype=bool)
+    pattern = _DATA_TYPE_PATTERNS.get(expected_type)
+    if pattern is not None:
+        is_str = series.map(type).isin(_STRING_TYPES)
+        mask = (series.astype(object).where(is_str, "").str.fullmatch(pattern) & is_str).to_numpy(dtype=bool)
+        # Non-string cells are rare here, so they go through the scalar check
+        others = ~is_str.to_numpy(dtype=bool)
+        if others.any():
+            mask[others] = series[others].map(_DATA_TYPE_CHECKS[expected_type]).to_numpy(dtype=bool)
+        return mask
+    if expected_type not in ("string", "numeric", "date"):
+        return np.ones(len(series), dtype=bool)
+    if expected_type == "numeric" and pd.api.types.is_numeric_dtype(series.dtype):
+        return np.ones(len(series), dtype=bool)
+    if expected_type == "date" and pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return np.ones(len(series), dtype=bool)
+    if expected_type == "string" and isinstance(series.dtype, pd.StringDtype):
+        return series.notna().to_numpy(dtype=bool)
+    
+    types = series.map(type)
+    is_str = types.isin(_STRING_TYPES)
+    if expected_type == "string":
+        return is_str.to_numpy(dtype=bool)
+    strings = series.astype(object).where(is_str, "")
+    if expected_type == "numeric":
+        numeric_strings = strings.str.match(_NUM_RE)
+        return (types.isin(_NUMERIC_TYPES) | numeric_strings).to_numpy(dtype=bool)
+    # pd.to_datetime accepts numbers as epoch offsets and NaT-like strings as missing
+    nat_like = series.isna() | (is_str & strings.isin(_NAT_STRINGS))
+    mask = (_parse_dates(series).notna() | types.isin(_EPOCH_TYPES) | nat_like).to_numpy(dtype=bool)
+    # A NaT from the bulk parse only makes a value a candidate: the scalar check
+    # decides, once per distinct value
+    rejected = ~mask
+    if rejected.any():
+        mask[rejected] = _map_unique(series[rejected], _is_date_value).to_numpy(dtype=bool)
+    return mask
+
+try:
+    import cudf
+    CUDF_AVAILABLE = True
+except ImportError:  # cudf is optional, GPU requests run on the CPU
+    cudf = None
+    CUDF_AVAILABLE = False
+
+def _gpu_str(series: Any) -> Any:
+    """cuDF counterpart of _as_str"""
+    if series.dtype != "object":
+        series = series.astype("str")
+    return series.fillna("")
+
+# Transformations whose cuDF kernels match the CPU results; other chains run on the CPU
+GPU_VECTOR_OPS: Dict[str, Callable[[Any], Any]] = {
+    "uppercase": lambda s: _gpu_str(s).str.upper(),
+    "lowercase": lambda s: _gpu_str(s).str.lower(),
+    "trim": lambda s: _gpu_str(s).str.strip(),
+}
+
+def _log_error_summary(message: str, errors: List[tuple]):
+    """Log buffered per-row failures as one line with the first few samples"""
+    if errors:
+        logger.error(f"{message}: {len(errors)} errors, first {min(len(errors), _ERROR_LOG_SAMPLES)}: {errors[:_ERROR_LOG_SAMPLES]}")
+
 class TransformationType(Enum):
     STRING = "string"
     NUMERIC = "numeric"
@@ -25,6 +895,10 @@ class ValidationSeverity(Enum):
     WARNING = "warning"
     INFO = "info"
 
+# Bound once so the per-row validation code does plain global loads
+_SEV_ERROR = ValidationSeverity.ERROR
+_SEV_INFO = ValidationSeverity.INFO
+
 class MappingError(Exception):
     """Custom exception for mapping errors"""
     pass
@@ -47,16 +921,72 @@ class TransformationResult:
 class MappingEngine:
     """Enhanced mapping engine with ERPNext specific transformations and validation"""
     
-    def __init__(self):
+    def __init__(self, strict_email: bool = False):
+        # Full regex validation of emails instead of the structural check
+        self.strict_email = strict_email
+        # Memoize the pure per-value helpers before the registries bind them
+        for name in _MEMOIZED_TRANSFORMS:
+            setattr(self, name, _memoized(getattr(self, name)))
         self.transformations = self._initialize_transformations()
         self.custom_transformations: Dict[str, Callable] = {}
         self.erpnext_transformations = self._initialize_erpnext_transformations()
+        self._dispatch: Dict[str, Callable] = {}
+        self._needs_row = frozenset({"concat", "conditional"})
+        self._rebuild_dispatch()
         self.performance_stats = {
             "total_records_processed": 0,
             "total_transformations": 0,
             "transformation_errors": 0,
-            "average_processing_time": 0.0
+            "total_processing_time_ns": 0,
+            "average_processing_time": 0.0,
+            "date_format_hits": {}
+        }
+        # Tried in order by _format_date_iso and re-sorted by observed hit count
+        self._date_formats: tuple = _DATE_FORMATS
+        self._date_parses_since_sort = 0
+        self._date_parse_cache: Dict[int, tuple] = {}
+        self._stats_lock = threading.Lock()
+        # Mapping spec fingerprint -> runner generated by compile_mapping
+        self._compiled_mappings = _SpecCache()
+        # Validation rules + target fields fingerprint -> plan built by _compile_validation
+        self._validation_plans = _SpecCache()
+        # Mapping config fingerprint -> validate_mapping_config result
+        self._config_checks = _SpecCache()
+        # Row dependent transformations with a whole-frame implementation
+        self._frame_vector_ops: Dict[str, Callable[..., Any]] = {
+            "concat": self._concat_fields_vec,
+            "conditional": self._conditional_transform_vec
+        }
+        # Scalar transformations run once per distinct value in column mode
+        self._unique_vector_ops: Dict[str, Callable[[Any], Any]] = {
+            "email_normalize": self._normalize_email,
+            "phone_international": self._format_phone_international,
+            "erpnext_customer_code": self._format_erpnext_customer_code,
+            "one_zero_to_boolean": self._one_zero_to_boolean,
+        }
+        # Every transformation some whole-column path can run
+        self._column_op_names = frozenset(VECTOR_OPS).union(
+            DATE_VECTOR_OPS, self._frame_vector_ops, self._unique_vector_ops
+        )
+    
+    def _rebuild_dispatch(self):
+        """Flatten the transformation registries into a single name -> function table"""
+        # Later registries win: ERPNext, then built-in, then custom transformations
+        self._dispatch = {
+            name: config["function"]
+            for registry in (self.custom_transformations, self.transformations, self.erpnext_transformations)
+            for name, config in registry.items()
         }
+        self._merged_transformations = MappingProxyType(
+            {**self.transformations, **self.erpnext_transformations, **self.custom_transformations}
+        )
+        self._by_endpoint_index: Dict[ERPNextEndpoint, Mapping[str, Any]] = {}
+        for endpoint, relevant in _ENDPOINT_TRANSFORMATIONS.items():
+            self._by_endpoint_index[endpoint] = MappingProxyType({
+                name: config for name, config in self._merged_transformations.items()
+                if config.get("type") != TransformationType.ERPNEXT or name in self.custom_transformations
+                or name in relevant or name in _GENERAL_ERPNEXT_TRANSFORMATIONS
+            })
     
     def _initialize_transformations(self) -> Dict[str, Dict[str, Any]]:
         """Initialize built-in transformation functions"""
@@ -83,7 +1013,7 @@ class MappingEngine:
                 "description": "Remove leading and trailing whitespace"
             },
             "remove_extra_spaces": {
-                "function": lambda x: re.sub(r'\s+', ' ', str(x).strip()) if x is not None else "",
+                "function": lambda x: _RE_WS.sub(' ', str(x).strip()) if x is not None else "",
                 "type": TransformationType.STRING,
                 "description": "Remove extra whitespace between words"
             },
@@ -93,7 +1023,7 @@ class MappingEngine:
                 "description": "Remove special characters"
             },
             "keep_alphanumeric": {
-                "function": lambda x: re.sub(r'[^a-zA-Z0-9\s]', '', str(x)) if x is not None else "",
+                "function": lambda x: _RE_NON_ALNUM_SPACE.sub('', str(x)) if x is not None else "",
                 "type": TransformationType.STRING,
                 "description": "Keep only alphanumeric characters and spaces"
             },
@@ -124,6 +1054,16 @@ class MappingEngine:
                 "type": TransformationType.NUMERIC,
                 "description": "Convert to decimal for precise arithmetic"
             },
+            "to_fixed_cents": {
+                "function": self._to_fixed_cents,
+                "type": TransformationType.NUMERIC,
+                "description": "Convert currency amount to integer cents"
+            },
+            "to_scaled_integer": {
+                "function": self._to_scaled_integer,
+                "type": TransformationType.NUMERIC,
+                "description": "Convert amount to an integer count of 10^-precision units"
+            },
             "round_decimal": {
                 "function": self._round_decimal,
                 "type": TransformationType.NUMERIC,
@@ -292,8 +1232,7 @@ class MappingEngine:
         
         code = str(value).strip().upper()
         # Remove special characters, keep alphanumeric and hyphens/underscores
-        code = re.sub(r'[^a-zA-Z0-9_-]', '', code)
-        return code
+        return code.encode('ascii', 'ignore').decode('ascii').translate(_CUST_CODE_DELETE)
     
     def _format_erpnext_customer_name(self, value: Any) -> str:
         """Format customer name for ERPNext"""
@@ -317,14 +1256,7 @@ class MappingEngine:
             return "Myanmar"  # Default territory
         
         territory = str(value).strip().title()
-        # Map common territory variations
-        territory_map = {
-            "burma": "Myanmar",
-            "myanmar (burma)": "Myanmar",
-            "mm": "Myanmar",
-            "mmr": "Myanmar"
-        }
-        return territory_map.get(territory.lower(), territory)
+        return _TERRITORY_MAP.get(territory.lower(), territory)
     
     def _format_erpnext_item_code(self, value: Any) -> str:
         """Format item code for ERPNext"""
@@ -333,8 +1265,7 @@ class MappingEngine:
         
         code = str(value).strip().upper()
         # Remove special characters, keep alphanumeric and hyphens
-        code = re.sub(r'[^a-zA-Z0-9-]', '', code)
-        return code
+        return code.encode('ascii', 'ignore').decode('ascii').translate(_ITEM_CODE_DELETE)
     
     def _format_erpnext_item_name(self, value: Any) -> str:
         """Format item name for ERPNext"""
@@ -350,18 +1281,10 @@ class MappingEngine:
             return "Products"  # Default item group
         
         group = str(value).strip().title()
-        # Map common item groups
-        group_map = {
-            "product": "Products",
-            "goods": "Products",
-            "material": "Products",
-            "service": "Services",
-            "raw material": "Raw Materials"
-        }
-        return group_map.get(group.lower(), group)
+        return _GROUP_MAP.get(group.lower(), group)
     
-    def _format_erpnext_quantity(self, value: Any) -> float:
-        """Format quantity for ERPNext sales"""
+    def _format_erpnext_quantity(self, value: Any, dtype: Optional[str] = None) -> float:
+        """Format quantity for ERPNext sales (``dtype`` only narrows column storage)"""
         try:
             quantity = float(value)
             return max(0.0, quantity)  # Ensure non-negative
@@ -382,20 +1305,7 @@ class MappingEngine:
             return "Nos"  # Default UOM
         
         uom = str(value).strip().title()
-        # Map common UOM variations
-        uom_map = {
-            "piece": "Nos",
-            "pieces": "Nos",
-            "unit": "Nos",
-            "units": "Nos",
-            "kilogram": "Kg",
-            "kilograms": "Kg",
-            "gram": "Gram",
-            "grams": "Gram",
-            "meter": "Meter",
-            "meters": "Meter"
-        }
-        return uom_map.get(uom.lower(), uom)
+        return _UOM_MAP.get(uom.lower(), uom)
     
     def _format_erpnext_company(self, value: Any) -> str:
         """Format company name for ERPNext"""
@@ -421,47 +1331,34 @@ class MappingEngine:
             return "Receive"  # Default payment type
         
         payment_type = str(value).strip().title()
-        # Map common payment types
-        payment_map = {
-            "payment": "Pay",
-            "receipt": "Receive",
-            "income": "Receive",
-            "expense": "Pay",
-            "in": "Receive",
-            "out": "Pay"
-        }
-        return payment_map.get(payment_type.lower(), "Receive")
+        return _PAYMENT_MAP.get(payment_type.lower(), "Receive")
     
     # Existing transformation methods (unchanged but included for completeness)
     def _remove_special_chars(self, text: Any, allowed_chars: str = "") -> str:
         """Remove special characters with configurable allowed characters"""
         if text is None:
             return ""
-        pattern = f'[^a-zA-Z0-9\\s{re.escape(allowed_chars)}]'
-        return re.sub(pattern, '', str(text))
+        return _special_chars_pattern(allowed_chars).sub('', str(text))
     
     def _normalize_email(self, email: Any) -> str:
         """Normalize email address"""
         if not email:
             return ""
-        email_str = str(email).lower().strip()
-        if re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email_str):
-            return email_str
-        return ""
+        return _normalize_email_text(str(email).lower().strip(), bool(self.strict_email))
     
     def _format_phone_international(self, phone: Any) -> str:
         """Format phone number to international format"""
         if not phone:
             return ""
-        cleaned = re.sub(r'[^\d+]', '', str(phone))
+        cleaned = _RE_PHONE_STRIP.sub('', str(phone))
         if cleaned.startswith('0'):
             cleaned = cleaned[1:]
         if not cleaned.startswith('+'):
             cleaned = '+1' + cleaned
         return cleaned
     
-    def _to_float(self, value: Any) -> float:
-        """Convert to float with error handling"""
+    def _to_float(self, value: Any, dtype: Optional[str] = None) -> float:
+        """Convert to float with error handling (``dtype`` only narrows column storage)"""
         if value is None or value == "":
             return 0.0
         try:
@@ -469,8 +1366,8 @@ class MappingEngine:
         except (ValueError, TypeError):
             return 0.0
     
-    def _to_integer(self, value: Any) -> int:
-        """Convert to integer with error handling"""
+    def _to_integer(self, value: Any, dtype: Optional[str] = None) -> int:
+        """Convert to integer with error handling (``dtype`` only narrows column storage)"""
         if value is None or value == "":
             return 0
         try:
@@ -487,6 +1384,24 @@ class MappingEngine:
         except (InvalidOperation, ValueError, TypeError):
             return Decimal('0.00')
     
+    def _to_fixed_cents(self, value: Any) -> int:
+        """Convert currency amount to integer cents"""
+        return self._to_scaled_integer(value, 2)
+    
+    def _to_scaled_integer(self, value: Any, precision: int = 2) -> int:
+        """Convert amount to an integer count of 10^-precision units (fixed point)
+        
+        Raises ValueError when the scaled amount does not fit in int64, the
+        storage the column kernel uses.
+        """
+        amount = self._to_float(value)
+        if not math.isfinite(amount):
+            return 0
+        scaled = int(round(amount * 10 ** precision))
+        if not -2 ** 63 <= scaled < 2 ** 63:
+            raise ValueError(f"{value!r} scaled by 10^{precision} is outside the int64 range")
+        return scaled
+    
     def _round_decimal(self, value: Any, decimals: int = 2) -> float:
         """Round to specified decimal places"""
         try:
@@ -511,79 +1426,58 @@ class MappingEngine:
     
     def _format_date_iso(self, date_str: Any) -> str:
         """Parse and format date to ISO 8601"""
+        iso, fmt = self._parse_date(date_str)
+        if fmt is not None:
+            self._record_date_format_hit(fmt)
+        return iso
+    
+    def _parse_date(self, date_str: Any) -> tuple:
+        """ISO 8601 text of a date value and the entry of _date_formats that parsed it, if any"""
         if not date_str:
-            return ""
+            return "", None
         try:
             if isinstance(date_str, (datetime, date)):
-                return date_str.isoformat()
+                return date_str.isoformat(), None
             date_str = str(date_str).strip()
-            date_formats = [
-                '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d',
-                '%m-%d-%Y', '%d-%m-%Y', '%Y.%m.%d', '%d.%m.%Y',
-                '%b %d, %Y', '%B %d, %Y', '%d %b %Y', '%d %B %Y'
-            ]
-            for fmt in date_formats:
-                try:
-                    date_obj = datetime.strptime(date_str, fmt)
-                    return date_obj.date().isoformat()
-                except ValueError:
-                    continue
-            return date_str
+            # Already ISO: strptime would round-trip it unchanged or fail and fall through
+            if _ISO_FAST.match(date_str):
+                return date_str, None
+            return _parse_date_text(date_str, self._date_formats)
         except Exception as e:
             logger.warning(f"Date parsing failed for '{date_str}': {e}")
-           return str(date_str)
+            return str(date_str), None
+    
+    def _record_date_format_hit(self, fmt: str, count: int = 1):
+        """Count successful parses of a format and periodically move the most used formats first"""
+        with self._stats_lock:
+            hits = self.performance_stats["date_format_hits"]
+            hits[fmt] = hits.get(fmt, 0) + count
+            self._date_parses_since_sort += count
+            if self._date_parses_since_sort >= _DATE_RESORT_INTERVAL:
+                self._date_parses_since_sort = 0
+                # Stable sort keeps the declared order among formats with equal counts; the
+                # tuple is replaced rather than sorted in place while other threads read it
+                self._date_formats = tuple(sorted(self._date_formats, key=lambda f: hits.get(f, 0), reverse=True))
     
     def _format_date_us(self, date_str: Any) -> str:
         """Format date as MM/DD/YYYY"""
-        iso_date = self._format_date_iso(date_str)
-        if iso_date and len(iso_date) >= 10:
-            try:
-                date_obj = datetime.strptime(iso_date[:10], '%Y-%m-%d')
-                return date_obj.strftime('%m/%d/%Y')
-            except ValueError:
-                pass
-        return str(date_str)
+        return _iso_to_format(self._format_date_iso(date_str), date_str, '%m/%d/%Y')
     
     def _format_date_european(self, date_str: Any) -> str:
         """Format date as DD/MM/YYYY"""
-        iso_date = self._format_date_iso(date_str)
-        if iso_date and len(iso_date) >= 10:
-            try:
-                date_obj = datetime.strptime(iso_date[:10], '%Y-%m-%d')
-                return date_obj.strftime('%d/%m/%Y')
-            except ValueError:
-                pass
-        return str(date_str)
+        return _iso_to_format(self._format_date_iso(date_str), date_str, '%d/%m/%Y')
     
     def _extract_year(self, date_str: Any) -> int:
         """Extract year from date"""
-        iso_date = self._format_date_iso(date_str)
-        if iso_date and len(iso_date) >= 4:
-            try:
-                return int(iso_date[:4])
-            except ValueError:
-                pass
-        return 0
+        return _iso_part(self._format_date_iso(date_str), 0, 4)
     
     def _extract_month(self, date_str: Any) -> int:
         """Extract month from date"""
-        iso_date = self._format_date_iso(date_str)
-        if iso_date and len(iso_date) >= 7:
-            try:
-                return int(iso_date[5:7])
-            except ValueError:
-                pass
-        return 0
+        return _iso_part(self._format_date_iso(date_str), 5, 7)
     
     def _extract_day(self, date_str: Any) -> int:
         """Extract day from date"""
-        iso_date = self._format_date_iso(date_str)
-        if iso_date and len(iso_date) >= 10:
-            try:
-                return int(iso_date[8:10])
-            except ValueError:
-                pass
-        return 0
+        return _iso_part(self._format_date_iso(date_str), 8, 10)
     
     def _to_boolean(self, value: Any) -> bool:
         """Convert to boolean"""
@@ -593,16 +1487,13 @@ class MappingEngine:
             return value
         if isinstance(value, (int, float)):
             return bool(value)
-        str_val = str(value).lower().strip()
-        true_values = ['true', 'yes', 'y', '1', 'on', 't']
-        return str_val in true_values
+        return str(value).lower().strip() in _TRUE_TOKENS
     
     def _yes_no_to_boolean(self, value: Any) -> bool:
         """Convert 'yes'/'no' to boolean"""
         if value is None:
             return False
-        str_val = str(value).lower().strip()
-        return str_val in ['yes', 'y', 'true']
+        return str(value).lower().strip() in _YES_TOKENS
     
     def _one_zero_to_boolean(self, value: Any) -> bool:
         """Convert 1/0 to boolean"""
@@ -618,8 +1509,10 @@ class MappingEngine:
         values = []
         for field in fields:
             value = row.get(field, "")
-            if value is not None and str(value).strip():
-                values.append(str(value).strip())
+            if value is not None:
+                text = str(value).strip()
+                if text:
+                    values.append(text)
         return separator.join(values)
     
     def _conditional_transform(self, row: pd.Series, condition: Dict, transformations: Dict) -> Any:
@@ -646,9 +1539,9 @@ class MappingEngine:
             elif operator == "less_than":
                 condition_met = float(field_value) < float(value)
             elif operator == "empty":
-                condition_met = not field_value or str(field_value).strip() == ""
+                condition_met = _is_empty_value(field_value)
             elif operator == "not_empty":
-                condition_met = bool(field_value) and str(field_value).strip() != ""
+                condition_met = not _is_empty_value(field_value)
             
             return transformations.get("then") if condition_met else transformations.get("else")
             
@@ -656,6 +1549,58 @@ class MappingEngine:
             logger.error(f"Conditional transformation failed: {e}")
             return transformations.get("else")
     
+    def _concat_fields_vec(self, df: pd.DataFrame, fields: List[str], separator: str = " ") -> pd.Series:
+        """Vectorized equivalent of _concat_fields over a whole DataFrame"""
+        parts = [_as_str(df[field]).str.strip() for field in fields if field in df.columns]
+        if not parts:
+            return pd.Series("", index=df.index, dtype=_STRING_DTYPE)
+        if len(parts) == 1:
+            return parts[0]
+        # One join over all parts is right wherever every part is non-empty; rows
+        # with a gap must not get a doubled separator, so only those are rejoined
+        result = parts[0].str.cat(parts[1:], sep=separator)
+        gaps = np.zeros(len(df), dtype=bool)
+        for part in parts:
+            gaps |= (part == "").to_numpy(dtype=bool)
+        if gaps.any():
+            rows = zip(*(part.to_numpy(dtype=object)[gaps] for part in parts))
+            result[gaps] = [separator.join(value for value in row if value) for row in rows]
+        return result
+    
+    def _conditional_transform_vec(self, df: pd.DataFrame, condition: Dict, transformations: Dict) -> np.ndarray:
+        """Column version of _conditional_transform, choosing "then" or "else" per row"""
+        then_value = _object_scalar(transformations.get("then"))
+        else_value = _object_scalar(transformations.get("else"))
+        
+        field = condition.get("field")
+        operator = condition.get("operator")
+        value = condition.get("value")
+        
+        if field not in df.columns:
+            return np.where(np.zeros(len(df), dtype=bool), then_value, else_value)
+        
+        column = df[field]
+        try:
+            if operator == "equals":
+                mask = column.astype(str) == str(value)
+            elif operator == "not_equals":
+                mask = column.astype(str) != str(value)
+            elif operator == "contains":
+                mask = column.astype(str).str.contains(str(value), regex=False, na=False)
+            elif operator == "greater_than":
+                mask = pd.Series(_float_vec(column) > float(value), index=df.index)
+            elif operator == "less_than":
+                mask = pd.Series(_float_vec(column) < float(value), index=df.index)
+            elif operator in ("empty", "not_empty"):
+                mask = pd.Series(_empty_mask_vec(column, operator == "empty"), index=df.index)
+            else:
+                mask = pd.Series(False, index=df.index)
+        except (ValueError, TypeError) as e:
+            logger.error(f"Conditional transformation failed: {e}")
+            mask = pd.Series(False, index=df.index)
+        
+        return np.where(mask.to_numpy(dtype=bool), then_value, else_value)
+    
     def _lookup_value(self, value: Any, lookup_table: Dict, default: Any = None) -> Any:
         """Lookup value from mapping table"""
         if value is None:
@@ -669,47 +1614,43 @@ class MappingEngine:
         return value
     
     # Core Mapping Methods
-    def _get_source_value(self, row: pd.Series, mapping: Dict, row_index: int) -> Any:
-        """Get source value from row based on mapping configuration"""
-        try:
-            source_field = mapping.get("source_column")
-            if not source_field:
-                return None
-            
-            if source_field in row:
-                return row[source_field]
-            else:
-                logger.warning(f"Source field '{source_field}' not found in row {row_index}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error getting source value for row {row_index}: {e}")
+    def _get_source_values(self, columns: Dict[str, np.ndarray], mapping: Dict) -> Optional[np.ndarray]:
+        """Resolve the source column array for a mapping once per DataFrame"""
+        source_field = mapping.get("source_column")
+        if not source_field:
             return None
+        values = columns.get(source_field)
+        if values is None:
+            logger.warning(f"Source field '{source_field}' not found in DataFrame")
+        return values
+    
+    def _compile_steps(self, mapping: Dict) -> List[tuple]:
+        """Resolve a mapping's transformation chain to (name, function, params, needs_row) steps"""
+        steps = []
+        for transform_config in mapping.get("transformations", []):
+            transform_name = transform_config.get("name")
+            transform_func = self._dispatch.get(transform_name)
+            if transform_func is None:
+                logger.warning(f"Unknown transformation: {transform_name}")
+                continue
+            steps.append((transform_name, transform_func, transform_config.get("parameters", {}),
+                          transform_name in self._needs_row))
+        return steps
     
-    def _apply_transformations(self, value: Any, mapping: Dict, row: pd.Series, row_index: int) -> Any:
-        """Apply transformations to value"""
+    def _apply_transformations(self, value: Any, steps: List[tuple], row: Optional[Dict[str, Any]], row_index: Any,
+                               error_buffer: Optional[List[tuple]] = None) -> Any:
+        """Apply compiled transformation steps (see ``_compile_steps``) to value
+        
+        Failures are appended to ``error_buffer`` as (row_index, transformation,
+        message) when given, so a batch can log them once; otherwise each is logged.
+        """
         try:
-            transformations = mapping.get("transformations", [])
             current_value = value
             
-            for transform_config in transformations:
-                transform_name = transform_config.get("name")
-                transform_params = transform_config.get("parameters", {})
-                
-                # Check ERPNext transformations first
-                if transform_name in self.erpnext_transformations:
-                    transform_func = self.erpnext_transformations[transform_name]["function"]
-                elif transform_name in self.transformations:
-                    transform_func = self.transformations[transform_name]["function"]
-                elif transform_name in self.custom_transformations:
-                    transform_func = self.custom_transformations[transform_name]["function"]
-                else:
-                    logger.warning(f"Unknown transformation: {transform_name}")
-                    continue
-                
+            for transform_name, transform_func, transform_params, needs_row in steps:
                 # Apply transformation
                 try:
-                    if transform_name in ["concat", "conditional"]:
+                    if needs_row:
                         # These transformations need the entire row
                         current_value = transform_func(row, **transform_params)
                     else:
@@ -718,8 +1659,13 @@ class MappingEngine:
                     self.performance_stats["total_transformations"] += 1
                     
                 except Exception as e:
-                    logger.error(f"Transformation '{transform_name}' failed for row {row_index}: {e}")
                     self.performance_stats["transformation_errors"] += 1
+                    if error_buffer is None:
+                        logger.error(f"Transformation '{transform_name}' failed for row {row_index}: {e}")
+                        continue
+                    error_buffer.append((row_index, transform_name, str(e)))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Transformation '{transform_name}' failed for row {row_index}: {e}")
             
             return current_value
             
@@ -727,11 +1673,154 @@ class MappingEngine:
             logger.error(f"Error applying transformations for row {row_index}: {e}")
             return value
     
-    def _validate_field(self, value: Any, field_name: str, validation_rules: Dict, row_index: int) -> Dict[str, Any]:
-        """Validate field value against validation rules"""
+    def _is_vectorizable(self, mapping: Dict, df: pd.DataFrame) -> bool:
+        """Check whether a mapping can be processed as a whole column"""
+        source_field = mapping.get("source_column")
+        if not source_field or source_field not in df.columns:
+            return False
+        return all(t.get("name") in self._column_op_names for t in mapping.get("transformations", []))
+    
+    def _date_uniques_cached(self, series: pd.Series) -> tuple:
+        """Distinct values of a column with their _parse_date results, reused for the same column object"""
+        cached = self._date_parse_cache.get(id(series))
+        if cached is not None and cached[0] is series:
+            return cached[1]
+        codes, uniques = _factorize_exact(series)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        parsed = (codes, uniques, [self._parse_date(value) for value in uniques], counts)
+        # Keep a reference to the source so its id cannot be reused while cached
+        self._date_parse_cache[id(series)] = (series, parsed)
+        return parsed
+    
+    def _map_date_column(self, transform_name: str, series: pd.Series, errors: List[tuple]) -> pd.Series:
+        """Run a date transformation over a column, parsing each distinct value once
+        
+        Format hits are counted per row, as the scalar path counts them.
+        Missing cells go through the scalar transformation.
+        """
+        codes, uniques, parsed, counts = self._date_uniques_cached(series)
+        finish = DATE_VECTOR_OPS[transform_name]
+        results = np.empty(len(uniques) + 1, dtype=object)
+        for position, ((iso, fmt), value, count) in enumerate(zip(parsed, uniques, counts)):
+            if fmt is not None:
+                self._record_date_format_hit(fmt, int(count))
+            results[position] = finish(iso, value)
+        result = pd.Series(results[codes], index=series.index, dtype=object)
+        missing = codes == -1
+        return _redo_cells(result, series, missing, missing, transform_name,
+                           self._dispatch[transform_name], {}, errors)
+    
+    def apply_pipeline_vectorized(self, series: pd.Series, transformations: List[Dict[str, Any]],
+                                  df: Optional[pd.DataFrame] = None) -> pd.Series:
+        """Apply a transformation chain to an entire column using pandas kernels
+        
+        ``df`` is the frame ``series`` belongs to; it is required for row
+        dependent transformations such as ``conditional``.
+        """
+        current = series
+        errors: List[tuple] = []
+        for transform_config in transformations:
+            transform_name = transform_config.get("name")
+            transform_params = transform_config.get("parameters", {})
+            if transform_name in DATE_VECTOR_OPS:
+                current = self._map_date_column(transform_name, current, errors)
+            elif transform_name in self._frame_vector_ops:
+                if df is None:
+                    raise MappingError(f"Transformation '{transform_name}' needs the source DataFrame")
+                current = pd.Series(
+                    self._frame_vector_ops[transform_name](df, **transform_params), index=df.index
+                )
+            elif transform_name in self._unique_vector_ops:
+                current = _map_unique(current, self._unique_vector_ops[transform_name])
+            else:
+                current = _run_kernel(transform_name, VECTOR_OPS[transform_name], current,
+                                      self._dispatch[transform_name], transform_params, errors)
+        
+        with self._stats_lock:
+            self.performance_stats["total_transformations"] += len(series) * len(transformations)
+            self.performance_stats["transformation_errors"] += len(errors)
+        _log_error_summary("Column transformations failed", errors)
+        return current
+    
+    def _precompute_validation_masks(self, transformed: pd.DataFrame, validation_rules: Dict) -> Dict[str, np.ndarray]:
+        """Check the expected data type of every validated column in one vector pass"""
+        return {
+            field_name: _data_type_mask(transformed[field_name], rules["data_type"])
+            for field_name, rules in validation_rules.items()
+            if rules.get("data_type") and field_name in transformed.columns
+        }
+    
+    def _precompute_numeric_range_flags(self, transformed: pd.DataFrame, validation_rules: Dict) -> Dict[str, np.ndarray]:
+        """Run purely numeric rule sets over whole columns with the compiled range kernel
+        
+        Only NumPy numeric columns qualify: they hold no None, so the required
+        and data type checks always pass and the range bits are the whole result.
+        """
+        flags = {}
+        for field_name, rules in validation_rules.items():
+            if (field_name not in transformed.columns or rules.get("data_type") != "numeric"
+                    or not _NUMERIC_KERNEL_RULES.issuperset(rules)):
+                continue
+            column = transformed[field_name]
+            bounds = (rules.get("min_value"), rules.get("max_value"))
+            if not isinstance(column.dtype, np.dtype) or column.dtype.kind not in "biuf":
+                continue
+            if not all(bound is None or (isinstance(bound, (int, float)) and not isinstance(bound, bool)) for bound in bounds):
+                continue
+            flags[field_name] = numeric_range_flags(column.to_numpy(dtype=np.float64), *bounds)
+        return flags
+    
+    def _validation_candidates(self, column: pd.Series, rules: Dict, type_mask: Optional[np.ndarray],
+                               pattern: Optional[re.Pattern]) -> np.ndarray:
+        """Rows of a transformed column that might fail their rules; all others are known to pass
+        
+        Each check is a vectorized over-approximation of the matching check in
+        _validate_field, which still decides and words the errors for the rows
+        flagged here.
+        """
+        values = column.astype(object)
+        types = values.map(type)
+        is_none = (types == type(None)).to_numpy(dtype=bool)
+        is_str = types.isin(_STRING_TYPES)
+        strings = values.where(is_str, "")
+        may_fail = np.zeros(len(column), dtype=bool)
+        
+        if rules.get("required", False):
+            may_fail |= is_none | (is_str & (strings.str.strip() == "")).to_numpy(dtype=bool)
+        
+        expected_type = rules.get("data_type")
+        if expected_type:
+            may_fail |= ~is_none & (True if type_mask is None else ~type_mask)
+        
+        min_val, max_val = rules.get("min_value"), rules.get("max_value")
+        if expected_type == "numeric" and (min_val is not None or max_val is not None):
+            try:
+                numbers = pd.to_numeric(values, errors='coerce')
+                in_range = numbers.notna()
+                if min_val is not None:
+                    in_range &= numbers >= min_val
+                if max_val is not None:
+                    in_range &= numbers <= max_val
+                may_fail |= ~is_none & ~in_range.to_numpy(dtype=bool)
+            except (ValueError, TypeError):
+                may_fail |= ~is_none
+        
+        if pattern is not None:
+            may_fail |= (is_str & ~strings.str.match(pattern).astype(bool)).to_numpy(dtype=bool)
+        return may_fail
+    
+    def _validate_field(self, value: Any, field_name: str, validation_rules: Dict, row_index: int,
+                        type_valid: Optional[bool] = None,
+                        compiled_patterns: Optional[Dict[str, re.Pattern]] = None) -> Dict[str, Any]:
+        """Validate field value against validation rules
+        
+        ``type_valid`` is the precomputed data type check for ``value`` and
+        ``compiled_patterns`` holds the precompiled rule patterns by field;
+        when omitted both are worked out per value.
+        """
         errors = []
         warnings = []
-        severity = ValidationSeverity.INFO
+        severity = _SEV_INFO
         
         field_rules = validation_rules.get(field_name, {})
         
@@ -739,15 +1828,16 @@ class MappingEngine:
         if field_rules.get("required", False):
             if value is None or (isinstance(value, str) and not value.strip()):
                 errors.append(f"Required field '{field_name}' is empty")
-                severity = ValidationSeverity.ERROR
+                severity = _SEV_ERROR
         
         # Data type validation
         expected_type = field_rules.get("data_type")
         if expected_type and value is not None:
-            type_valid = self._validate_data_type(value, expected_type)
+            if type_valid is None:
+                type_valid = self._validate_data_type(value, expected_type)
             if not type_valid:
                 errors.append(f"Field '{field_name}' has invalid data type. Expected: {expected_type}")
-                severity = ValidationSeverity.ERROR
+                severity = _SEV_ERROR
         
         # Range validation for numeric fields
         if expected_type == "numeric" and value is not None:
@@ -758,19 +1848,20 @@ class MappingEngine:
                 num_value = float(value)
                 if min_val is not None and num_value < min_val:
                     errors.append(f"Field '{field_name}' value {num_value} is below minimum {min_val}")
-                    severity = ValidationSeverity.ERROR
+                    severity = _SEV_ERROR
                 if max_val is not None and num_value > max_val:
                     errors.append(f"Field '{field_name}' value {num_value} is above maximum {max_val}")
-                    severity = ValidationSeverity.ERROR
+                    severity = _SEV_ERROR
             except (ValueError, TypeError):
                 pass
         
         # Pattern validation for string fields
         pattern = field_rules.get("pattern")
         if pattern and value is not None and isinstance(value, str):
-            if not re.match(pattern, value):
+            compiled = compiled_patterns.get(field_name) if compiled_patterns else None
+            if not (compiled or _rule_pattern(pattern)).match(value):
                 errors.append(f"Field '{field_name}' does not match required pattern")
-                severity = ValidationSeverity.ERROR
+                severity = _SEV_ERROR
         
         return {
             "is_valid": len(errors) == 0,
@@ -780,25 +1871,13 @@ class MappingEngine:
         }
     
     def _validate_data_type(self, value: Any, expected_type: str) -> bool:
-        """Validate data type of value"""
-        try:
-            if expected_type == "string":
-                return isinstance(value, str) or value is None
-            elif expected_type == "numeric":
-                return isinstance(value, (int, float)) or (isinstance(value, str) and value.replace('.', '').isdigit())
-            elif expected_type == "date":
-                if isinstance(value, (datetime, date)):
-                    return True
-                # Try to parse as date
-                try:
-                    pd.to_datetime(value)
-                    return True
-                except:
-                    return False
-            elif expected_type == "boolean":
-                return isinstance(value, bool) or str(value).lower() in ['true', 'false', 'yes', 'no', '1', '0']
+        """Validate data type of value; unknown types always pass"""
+        check = _DATA_TYPE_CHECKS.get(expected_type)
+        if check is None:
             return True
-        except:
+        try:
+            return check(value)
+        except (ValueError, TypeError):
             return False
     
     # Public methods
@@ -810,37 +1889,494 @@ class MappingEngine:
             "type": transformation_type,
             "description": "Custom transformation"
         }
+        self._rebuild_dispatch()
+        # Transformation names checked by validate_mapping_config changed
+        self._config_checks.clear()
         logger.info(f"Registered custom transformation: {name}")
     
-    def get_available_transformations(self, endpoint: Optional[ERPNextEndpoint] = None) -> Dict[str, Any]:
-        """Get available transformations, optionally filtered by ERPNext endpoint"""
-        all_transformations = {**self.transformations, **self.erpnext_transformations, **self.custom_transformations}
+    def get_available_transformations(self, endpoint: Optional[ERPNextEndpoint] = None) -> Mapping[str, Any]:
+        """Get available transformations, optionally filtered by ERPNext endpoint
         
+        With an endpoint, generic transformations are kept and ERPNext ones are
+        limited to those relevant to it. The result is a read-only view that is
+        rebuilt when a custom transformation is registered.
+        """
         if endpoint:
-            # Filter transformations relevant to the endpoint
-            endpoint_specific = {}
-            for name, config in all_transformations.items():
-                if config.get("type") == TransformationType.ERPNEXT:
-                    endpoint_specific[name] = config
-                elif config.get("type") != TransformationType.ERPNEXT:
-                    endpoint_specific[name] = config
-            return endpoint_specific
-        
-        return all_transformations
-    
-    def apply_mapping(self, df: pd.DataFrame, mapping_config: Dict[str, Any]) -> Dict[str, Any]:
+            return self._by_endpoint_index.get(endpoint, self._merged_transformations)
+        return self._merged_transformations
+    
+    def validate_mapping_config(self, mapping_config: Dict[str, Any], fail_fast: bool = False) -> Dict[str, Any]:
+        """
+        Check a mapping configuration before it is saved or applied
+        
+        Args:
+            mapping_config: Mapping configuration (``target_columns``, optional
+                ``validation_rules`` and ``erp_endpoint``)
+            fail_fast: Stop at the first error (e.g. for a quick preflight)
+            
+        Returns:
+            Dict with ``is_valid``, ``errors`` and ``warnings``
+        """
+        key = _fingerprint([mapping_config, fail_fast])
+        checked = self._config_checks.get(key)
+        if checked is None:
+            errors: List[str] = []
+            warnings: List[str] = []
+            for is_error, message in self._mapping_config_issues(mapping_config):
+                if not is_error:
+                    warnings.append(message)
+                    continue
+                errors.append(message)
+                if fail_fast:
+                    break
+            checked = self._config_checks[key] = {"is_valid": not errors, "errors": errors, "warnings": warnings}
+        return {"is_valid": checked["is_valid"], "errors": list(checked["errors"]),
+                "warnings": list(checked["warnings"])}
+    
+    def _mapping_config_issues(self, mapping_config: Dict[str, Any]) -> Iterator[tuple]:
+        """Yield ``(is_error, message)`` for each problem in a mapping configuration, lazily"""
+        erp_endpoint = mapping_config.get("erp_endpoint")
+        erp_endpoint = getattr(erp_endpoint, "value", erp_endpoint)
+        if erp_endpoint is not None and erp_endpoint not in _VALID_ENDPOINTS:
+            yield True, f"Unknown ERP endpoint: {erp_endpoint}"
+        
+        target_columns = mapping_config.get("target_columns")
+        if not isinstance(target_columns, dict) or not target_columns:
+            yield True, "target_columns must map at least one target field to its configuration"
+            target_columns = {}
+        
+        for target_field, mapping in target_columns.items():
+            if not isinstance(mapping, dict):
+                yield True, f"Mapping for '{target_field}' must be an object"
+                continue
+            uses_source = True
+            for transform_config in mapping.get("transformations", []):
+                transform_name = transform_config.get("name")
+                if transform_name not in self._dispatch:
+                    yield True, f"Unknown transformation '{transform_name}' for '{target_field}'"
+                elif transform_name in _PARAMETERIZED_TRANSFORMS and not transform_config.get("parameters"):
+                    yield True, f"Transformation '{transform_name}' for '{target_field}' requires parameters"
+                if transform_name in self._needs_row or transform_name == "default_if_empty":
+                    uses_source = False
+            if uses_source and not mapping.get("source_column"):
+                yield False, f"Target field '{target_field}' has no source_column and will be empty"
+        
+        for field_name, rules in mapping_config.get("validation_rules", {}).items():
+            if field_name not in target_columns:
+                yield False, f"Validation rules given for unmapped field '{field_name}'"
+            data_type = rules.get("data_type")
+            if data_type and data_type not in _VALID_DATA_TYPES:
+                yield True, f"Unknown data_type '{data_type}' for '{field_name}'"
+            if rules.get("pattern"):
+                try:
+                    _rule_pattern(rules["pattern"])
+                except re.error as e:
+                    yield True, f"Invalid pattern for '{field_name}': {e}"
+    
+    def generate_sample_mapping(self, data_type: str) -> Dict[str, Any]:
+        """
+        Sample mapping configuration to start a new mapping from
+        
+        Args:
+            data_type: ``customers``, ``items`` or ``sales_orders``; anything
+                else gets the customer template
+            
+        Returns:
+            A fresh copy of the template, safe for the caller to edit
+        """
+        return copy.deepcopy(_SAMPLE_MAPPINGS.get(data_type, _SAMPLE_MAPPINGS["customers"]))
+    
+    def clear_caches(self):
+        """Drop memoized per-value results, e.g. after a large import with unique values"""
+        for name in _MEMOIZED_TRANSFORMS:
+            getattr(self, name).cache_clear()
+        _is_parseable_date.cache_clear()
+        _parse_date_text.cache_clear()
+        _normalize_email_text.cache_clear()
+        self._date_parse_cache.clear()
+    
+    def process_dataframe(self, df: pd.DataFrame, mappings: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Apply transformation chains column by column
+        
+        Chains made of vectorizable transformations run once over the whole
+        source column. The remaining (row dependent) mappings share a single
+        pass over the rows.
+        
+        Args:
+            df: Input DataFrame
+            mappings: Target field to mapping configuration (``target_columns``)
+            
+        Returns:
+            DataFrame with one column per target field, aligned to ``df.index``
+        """
+        out_cols: Dict[str, pd.Series] = {}
+        row_mappings: Dict[str, Dict[str, Any]] = {}
+        vector_mappings = {
+            target_field: mapping for target_field, mapping in mappings.items()
+            if self._is_vectorizable(mapping, df)
+        }
+        
+        # Column chains are independent and spend most of their time in GIL-releasing kernels
+        if len(df) >= _PARALLEL_MIN_ROWS and len(vector_mappings) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(vector_mappings), os.cpu_count() or 1)) as executor:
+                futures = {
+                    target_field: executor.submit(self._process_column, df, target_field, mapping)
+                    for target_field, mapping in vector_mappings.items()
+                }
+                column_results = {target_field: future.result() for target_field, future in futures.items()}
+        else:
+            column_results = {
+                target_field: self._process_column(df, target_field, mapping)
+                for target_field, mapping in vector_mappings.items()
+            }
+        self._date_parse_cache.clear()
+        
+        for target_field, mapping in mappings.items():
+            column = column_results.get(target_field)
+            if column is None:
+                row_mappings[target_field] = mapping
+            else:
+                out_cols[target_field] = column
+        
+        if row_mappings:
+            # Raw column arrays indexed by position instead of a Series lookup per row
+            columns = {name: df[name].to_numpy(dtype=object) for name in df.columns.unique()}
+            sources = {
+                target_field: self._get_source_values(columns, mapping)
+                for target_field, mapping in row_mappings.items()
+            }
+            transform_errors: List[tuple] = []
+            # Built-in chains over a missing source see None on every row, so they
+            # are evaluated once and broadcast (custom functions may not be pure)
+            for target_field, mapping in list(row_mappings.items()):
+                if sources[target_field] is not None or len(df) == 0 or any(
+                    name in self._needs_row or name in self.custom_transformations
+                    for name in _transform_names(mapping)
+                ):
+                    continue
+                del row_mappings[target_field]
+                value_errors: List[tuple] = []
+                transformations_before = self.performance_stats["total_transformations"]
+                errors_before = self.performance_stats["transformation_errors"]
+                value = self._apply_transformations(None, self._compile_steps(mapping), None, df.index[0], value_errors)
+                self.performance_stats["total_transformations"] += (
+                    self.performance_stats["total_transformations"] - transformations_before) * (len(df) - 1)
+                self.performance_stats["transformation_errors"] += (
+                    self.performance_stats["transformation_errors"] - errors_before) * (len(df) - 1)
+                transform_errors.extend(
+                    (row_index, transform_name, message)
+                    for row_index in df.index for _, transform_name, message in value_errors
+                )
+                out_cols[target_field] = pd.Series([value] * len(df), index=df.index, dtype=object)
+            row_values: Dict[str, List[Any]] = {target_field: [] for target_field in row_mappings}
+            needs_row = any(
+                t.get("name") in self._needs_row
+                for mapping in row_mappings.values() for t in mapping.get("transformations", [])
+            )
+            # Per mapping: its resolved steps, source array and output list, so the
+            # inner loop does positional indexing only
+            plans = [
+                (self._compile_steps(mapping), sources[target_field], row_values[target_field])
+                for target_field, mapping in row_mappings.items()
+            ]
+            names = list(columns)
+            row_tuples = zip(*columns.values()) if needs_row and columns else repeat(())
+            for position, (row_index, row_tuple) in enumerate(zip(df.index, row_tuples)):
+                row = dict(zip(names, row_tuple)) if needs_row else None
+                for steps, source_values, values in plans:
+                    source_value = None if source_values is None else source_values[position]
+                    values.append(self._apply_transformations(source_value, steps, row, row_index, transform_errors))
+            _log_error_summary("Row transformations failed", transform_errors)
+            for target_field, values in row_values.items():
+                out_cols[target_field] = pd.Series(values, index=df.index, dtype=object)
+        
+        return pd.DataFrame({target_field: out_cols[target_field] for target_field in mappings}, index=df.index)
+    
+    def compile_mapping(self, mappings: Dict[str, Dict[str, Any]]) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        """
+        Generate a single function applying a fixed mapping spec to a DataFrame
+        
+        Every vectorizable chain is unrolled into straight-line kernel calls, so
+        no transformation is looked up by name while a batch runs. Chains that
+        need row mode, frames of parallel size, and frames missing a source
+        column are delegated to ``process_dataframe``.
+        
+        Args:
+            mappings: Target field to mapping configuration (``target_columns``)
+            
+        Returns:
+            Function taking a DataFrame and returning the mapped DataFrame
+        """
+        key = _fingerprint(mappings)
+        runner = self._compiled_mappings.get(key)
+        if runner is not None:
+            return runner
+        
+        namespace: Dict[str, Any] = {
+            "pd": pd, "logger": logger, "_engine": self, "_map_unique": _map_unique,
+            "_run_kernel": _run_kernel, "_log_error_summary": _log_error_summary,
+            "_MAPPINGS": mappings, "_PARALLEL_MIN_ROWS": _PARALLEL_MIN_ROWS,
+        }
+        sources = set()
+        row_mappings: Dict[str, Dict[str, Any]] = {}
+        body: List[str] = []
+        transformation_count = 0
+        
+        for target_field, mapping in mappings.items():
+            source_field = mapping.get("source_column")
+            transformations = mapping.get("transformations", [])
+            if not source_field or not all(t.get("name") in self._column_op_names for t in transformations):
+                row_mappings[target_field] = mapping
+                continue
+            sources.add(source_field)
+            transformation_count += len(transformations)
+            body.append(f"v = df[{source_field!r}]")
+            for transform_config in transformations:
+                transform_name = transform_config.get("name")
+                op = f"_op{len(namespace)}"
+                params = f"_params{len(namespace)}"
+                namespace[params] = transform_config.get("parameters", {})
+                if transform_name in DATE_VECTOR_OPS:
+                    body.append(f"v = _engine._map_date_column({transform_name!r}, v, errors)")
+                elif transform_name in self._frame_vector_ops:
+                    namespace[op] = self._frame_vector_ops[transform_name]
+                    body.append(f"v = pd.Series({op}(df, **{params}), index=df.index)")
+                elif transform_name in self._unique_vector_ops:
+                    namespace[op] = self._unique_vector_ops[transform_name]
+                    body.append(f"v = _map_unique(v, {op})")
+                else:
+                    fn = f"_fn{len(namespace)}"
+                    namespace[op] = VECTOR_OPS[transform_name]
+                    namespace[fn] = self._dispatch[transform_name]
+                    body.append(f"v = _run_kernel({transform_name!r}, {op}, v, {fn}, {params}, errors)")
+            body.append(f"out[{target_field!r}] = v")
+        
+        namespace["_SOURCES"] = frozenset(sources)
+        namespace["_ROW_MAPPINGS"] = row_mappings
+        namespace["_TRANSFORMATIONS"] = transformation_count
+        fast_path = "\n".join(f"        {line}" for line in body) or "        pass"
+        src = f"""
+def _run(df):
+    if len(df) >= _PARALLEL_MIN_ROWS or not _SOURCES.issubset(df.columns):
+        return _engine.process_dataframe(df, _MAPPINGS)
+    out = {{}}
+    errors = []
+    try:
+{fast_path}
+    except Exception as e:
+        logger.warning(f"Compiled mapping failed, using process_dataframe: {{e}}")
+        return _engine.process_dataframe(df, _MAPPINGS)
+    finally:
+        _engine._date_parse_cache.clear()
+    with _engine._stats_lock:
+        _engine.performance_stats["total_transformations"] += len(df) * _TRANSFORMATIONS
+        _engine.performance_stats["transformation_errors"] += len(errors)
+    _log_error_summary("Column transformations failed", errors)
+    if _ROW_MAPPINGS:
+        rest = _engine.process_dataframe(df, _ROW_MAPPINGS)
+        for target_field in _ROW_MAPPINGS:
+            out[target_field] = rest[target_field]
+    return pd.DataFrame({{target_field: out[target_field] for target_field in _MAPPINGS}}, index=df.index)
+"""
+        exec(compile(src, "<mapping>", "exec"), namespace)
+        runner = namespace["_run"]
+        self._compiled_mappings[key] = runner
+        return runner
+    
+    def _compile_validation(self, target_columns: Dict[str, Dict[str, Any]],
+                            validation_rules: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Resolve the validated fields and compile their patterns once per spec"""
+        key = _fingerprint([list(target_columns), validation_rules])
+        plan = self._validation_plans.get(key)
+        if plan is None:
+            plan = {
+                "fields": [target_field for target_field in target_columns if validation_rules.get(target_field)],
+                "patterns": {
+                    field_name: _rule_pattern(rules["pattern"])
+                    for field_name, rules in validation_rules.items() if rules.get("pattern")
+                },
+            }
+            self._validation_plans[key] = plan
+        return plan
+    
+    def _process_column(self, df: pd.DataFrame, target_field: str, mapping: Dict[str, Any]) -> Optional[pd.Series]:
+        """Run one vectorizable mapping, returning None when it has to fall back to row mode"""
+        try:
+            return self.apply_pipeline_vectorized(
+                df[mapping["source_column"]], mapping.get("transformations", []), df
+            )
+        except Exception as e:
+            logger.warning(f"Vectorized transformation failed for '{target_field}', using row mode: {e}")
+            return None
+    
+    def _transform_on_gpu(self, df: Any, target_columns: Dict[str, Dict[str, Any]]) -> Optional[pd.DataFrame]:
+        """Run the mapping on the GPU when every chain has a cuDF kernel, else return None"""
+        sources = {mapping.get("source_column") for mapping in target_columns.values()}
+        if not all(
+            mapping.get("source_column") in df.columns
+            and all(t.get("name") in GPU_VECTOR_OPS and not t.get("parameters") for t in mapping.get("transformations", []))
+            for mapping in target_columns.values()
+        ):
+            return None
+        gdf = df if isinstance(df, cudf.DataFrame) else cudf.from_pandas(df[list(sources)])
+        out = {}
+        for target_field, mapping in target_columns.items():
+            column = gdf[mapping["source_column"]]
+            for transform_config in mapping.get("transformations", []):
+                column = GPU_VECTOR_OPS[transform_config["name"]](column)
+            out[target_field] = column
+        transformed = cudf.DataFrame(out).to_pandas()
+        transformed.index = df.index.to_pandas() if isinstance(df, cudf.DataFrame) else df.index
+        with self._stats_lock:
+            self.performance_stats["total_transformations"] += len(df) * sum(
+                len(mapping.get("transformations", [])) for mapping in target_columns.values()
+            )
+        return transformed
+    
+    def _rightsize_source_columns(self, df: pd.DataFrame, target_columns: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+        """Shrink referenced source columns to their smallest lossless dtype without touching ``df``
+        
+        Integers are downcast to the narrowest type holding their range and
+        low-cardinality string columns become ``category``. Floats are left
+        alone: float32 prints the same value with a shorter repr, which would
+        change string transformations of numeric columns.
+        """
+        if len(df) == 0 or not df.columns.is_unique:
+            return df
+        rightsized = {}
+        for source_field in {mapping.get("source_column") for mapping in target_columns.values()}:
+            if source_field not in df.columns:
+                continue
+            column = df[source_field]
+            kind = column.dtype.kind if isinstance(column.dtype, np.dtype) else None
+            if kind in ("i", "u"):
+                narrowed = pd.to_numeric(column, downcast="unsigned" if column.min() >= 0 else "integer")
+                if narrowed.dtype != column.dtype:
+                    rightsized[source_field] = narrowed
+                continue
+            if column.dtype != object:
+                continue
+            # Mixed-type columns would merge values such as 1 and True into one category, and
+            # categories turn None into NaN, which the scalar transformations treat differently
+            if column.hasnans or pd.api.types.infer_dtype(column, skipna=False) != "string":
+                continue
+            codes, uniques = pd.factorize(column)
+            if len(uniques) < _CATEGORY_MAX_RATIO * len(df):
+                rightsized[source_field] = pd.Series(
+                    pd.Categorical.from_codes(codes, uniques), index=df.index, name=source_field
+                )
+        return df.assign(**rightsized) if rightsized else df
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only the configuration; caches, locks and memoized wrappers are rebuilt"""
+        return {"strict_email": self.strict_email, "custom_transformations": self.custom_transformations}
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(strict_email=state["strict_email"])
+        self.custom_transformations.update(state["custom_transformations"])
+        self._rebuild_dispatch()
+    
+    def _apply_mapping_parallel(self, df: pd.DataFrame, mapping_config: Dict[str, Any], records: bool,
+                                n_workers: int) -> Dict[str, Any]:
+        """Map contiguous row groups in worker processes and merge their results"""
+        start_time = time.perf_counter_ns()
+        bounds = np.linspace(0, len(df), n_workers + 1).astype(int)
+        chunks = [df.iloc[lower:upper] for lower, upper in zip(bounds[:-1], bounds[1:])]
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=_PROCESS_CONTEXT) as executor:
+            results = list(executor.map(
+                _map_chunk, [self] * n_workers, chunks, [mapping_config] * n_workers, [records] * n_workers
+            ))
+        
+        if records:
+            mapped_data = [row for result in results for row in result["mapped_data"]]
+        else:
+            mapped_data = pd.concat([result["mapped_data"] for result in results])
+        validation_errors = [error for result in results for error in result["validation_errors"]]
+        
+        # Workers start from zeroed stats, so their totals are this call's deltas
+        hits = self.performance_stats["date_format_hits"]
+        for result in results:
+            worker_stats = result["processing_metadata"]["performance_stats"]
+            for key in ("total_records_processed", "total_transformations", "transformation_errors"):
+                self.performance_stats[key] += worker_stats[key]
+            for fmt, count in worker_stats["date_format_hits"].items():
+                hits[fmt] = hits.get(fmt, 0) + count
+        
+        return self._mapping_result(df, mapped_data, validation_errors, time.perf_counter_ns() - start_time,
+                                    mapping_config.get("erp_endpoint"))
+    
+    def _mapping_result(self, df: pd.DataFrame, mapped_data: Any, validation_errors: List[Dict[str, Any]],
+                        processing_time_ns: int, erp_endpoint: Any) -> Dict[str, Any]:
+        """Assemble the apply_mapping result and update the timing stats"""
+        processing_time = processing_time_ns / 1e9
+        # Lifetime average per record, matching the lifetime total_records_processed
+        stats = self.performance_stats
+        stats["total_processing_time_ns"] += processing_time_ns
+        stats["average_processing_time"] = stats["total_processing_time_ns"] / max(1, stats["total_records_processed"]) / 1e9
+        logger.info(f"Mapping completed: {len(mapped_data)}/{len(df)} records successful")
+        return {
+            "mapped_data": mapped_data,
+            "processing_metadata": {
+                "total_records_processed": len(df),
+                "successful_records": len(mapped_data),
+                "failed_records": len(validation_errors),
+                "success_rate": (len(mapped_data) / len(df)) * 100 if len(df) > 0 else 0,
+                "processing_time_seconds": processing_time,
+                "performance_stats": {
+                    **self.performance_stats,
+                    "date_format_hits": dict(self.performance_stats["date_format_hits"])
+                }
+            },
+            "validation_errors": validation_errors,
+            "erp_endpoint": erp_endpoint
+        }
+    
+    def apply_mapping(self, df: pd.DataFrame, mapping_config: Dict[str, Any], records: bool = True,
+                      parallel: bool = False, use_gpu: bool = False, n_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Apply column mapping and transformations to DataFrame with enhanced error handling
         
         Args:
             df: Input DataFrame
             mapping_config: Mapping configuration
+            records: Return ``mapped_data`` as a list of row dicts; when False it is
+                the DataFrame of valid rows, indexed like ``df``
+            parallel: Split frames of more than 50,000 rows across worker processes;
+                off by default, since each call pays for starting the workers
+            use_gpu: Transform on the GPU with cuDF when installed; implied for a
+                ``cudf.DataFrame`` input. Validation always runs on the CPU.
+            n_workers: Worker processes for large frames, defaults to the CPU count
             
         Returns:
             Dict containing mapped data and processing metadata
         """
-        start_time = datetime.now()
-        mapped_data = []
+        gpu_transformed = None
+        if use_gpu or (CUDF_AVAILABLE and isinstance(df, cudf.DataFrame)):
+            if not CUDF_AVAILABLE:
+                logger.warning("cuDF is not installed, mapping on the CPU")
+            else:
+                try:
+                    gpu_transformed = self._transform_on_gpu(df, mapping_config.get("target_columns", {}))
+                except Exception as e:
+                    logger.warning(f"GPU transformation failed, mapping on the CPU: {e}")
+                if isinstance(df, cudf.DataFrame):
+                    df = df.to_pandas()
+        
+        n_workers = n_workers or os.cpu_count() or 1
+        if gpu_transformed is None and parallel and len(df) > _PROCESS_MIN_ROWS and n_workers > 1:
+            try:
+                # Workers get a pickled copy; custom lambdas and closures cannot be sent
+                pickle.dumps((self, mapping_config))
+            except (pickle.PicklingError, AttributeError, TypeError) as e:
+                logger.warning(f"Mapping cannot be sent to worker processes, processing in a single process: {e}")
+            else:
+                try:
+                    return self._apply_mapping_parallel(df, mapping_config, records, n_workers)
+                except BrokenProcessPool as e:
+                    logger.warning(f"Worker processes failed, processing in a single process: {e}")
+        
+        start_time = time.perf_counter_ns()
         processing_errors = []
         validation_errors = []
         
@@ -849,77 +2385,138 @@ class MappingEngine:
         erp_endpoint = mapping_config.get("erp_endpoint")
         
         try:
-            for row_index, row in df.iterrows():
-                row_errors = []
-                mapped_row = {}
-                row_valid = True
+            # Transform column by column, then validate only the fields that have rules
+            if gpu_transformed is not None:
+                transformed = gpu_transformed
+            else:
+                transformed = self.compile_mapping(target_columns)(self._rightsize_source_columns(df, target_columns))
+            validation_plan = self._compile_validation(target_columns, validation_rules)
+            validated_fields = validation_plan["fields"]
+            row_is_valid = np.ones(len(df), dtype=bool)
+            
+            if validated_fields:
+                range_flags = self._precompute_numeric_range_flags(transformed, validation_rules)
+                type_masks = self._precompute_validation_masks(transformed, validation_rules)
+                compiled_patterns = validation_plan["patterns"]
+                # Each column is scanned once for rows that could fail; only those rows
+                # reach the per-value checks below
+                candidates = {
+                    target_field: self._validation_candidates(
+                        transformed[target_field], validation_rules[target_field],
+                        type_masks.get(target_field), compiled_patterns.get(target_field)
+                    )
+                    for target_field in validated_fields if target_field not in range_flags
+                }
+                row_may_fail = np.zeros(len(df), dtype=bool)
+                for field_mask in (*candidates.values(), *range_flags.values()):
+                    row_may_fail |= field_mask.astype(bool)
+                column_values = {
+                    target_field: transformed[target_field].tolist()
+                    for target_field, field_mask in candidates.items() if field_mask.any()
+                }
+                # Source rows are only materialized for the error report, from column
+                # arrays extracted when the first row fails
+                source_columns = df.columns.tolist()
+                source_arrays: Optional[List[np.ndarray]] = None
+                field_errors: List[tuple] = []
                 
-                for target_field, mapping in target_columns.items():
-                    try:
-                        # Get source value
-                        source_value = self._get_source_value(row, mapping, row_index)
-                        
-                        # Apply transformations
-                        transformed_value = self._apply_transformations(
-                            source_value, mapping, row, row_index
-                        )
-                        
-                        # Validate transformed value
-                        validation_result = self._validate_field(
-                            transformed_value, target_field, validation_rules, row_index
-                        )
-                        
-                        if not validation_result["is_valid"]:
-                            row_errors.extend(validation_result["errors"])
-                            if validation_result["severity"] == ValidationSeverity.ERROR:
+                row_labels = df.index.tolist() if row_may_fail.any() else []
+                for position in np.flatnonzero(row_may_fail):
+                    row_index = row_labels[position]
+                    row_errors = []
+                    row_valid = True
+                    
+                    for target_field in validated_fields:
+                        field_flags = range_flags.get(target_field)
+                        if field_flags is not None:
+                            if field_flags[position]:
+                                num_value = float(transformed[target_field].iat[position])
+                                field_rules = validation_rules[target_field]
+                                if field_flags[position] & RANGE_BELOW_MIN:
+                                    row_errors.append(f"Field '{target_field}' value {num_value} is below minimum {field_rules['min_value']}")
+                                if field_flags[position] & RANGE_ABOVE_MAX:
+                                    row_errors.append(f"Field '{target_field}' value {num_value} is above maximum {field_rules['max_value']}")
                                 row_valid = False
-                        
-                        # Add to mapped row
-                        mapped_row[target_field] = transformed_value
-                        
-                    except Exception as e:
-                        error_msg = f"Error mapping field '{target_field}' in row {row_index}: {str(e)}"
-                        row_errors.append(error_msg)
-                        row_valid = False
-                        logger.error(error_msg)
-                
-                # Add row to results if valid
-                if row_valid:
-                    mapped_data.append(mapped_row)
-                else:
-                    validation_errors.append({
-                        "row_index": row_index,
-                        "errors": row_errors,
-                        "original_data": row.to_dict()
-                    })
+                            continue
+                        if not candidates[target_field][position]:
+                            continue
+                        try:
+                            transformed_value = column_values[target_field][position]
+                            
+                            # Validate transformed value
+                            type_mask = type_masks.get(target_field)
+                            validation_result = self._validate_field(
+                                transformed_value, target_field, validation_rules, row_index,
+                                type_valid=None if type_mask is None else bool(type_mask[position]),
+                                compiled_patterns=compiled_patterns
+                            )
+                            
+                            if not validation_result["is_valid"]:
+                                row_errors.extend(validation_result["errors"])
+                                if validation_result["severity"] is _SEV_ERROR:
+                                    row_valid = False
+                            
+                        except Exception as e:
+                            error_msg = f"Error mapping field '{target_field}' in row {row_index}: {str(e)}"
+                            row_errors.append(error_msg)
+                            row_valid = False
+                            field_errors.append((row_index, target_field, str(e)))
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(error_msg)
+                    
+                    if not row_valid:
+                        row_is_valid[position] = False
+                        if source_arrays is None:
+                            source_arrays = [df.iloc[:, i].to_numpy(dtype=object) for i in range(len(source_columns))]
+                        validation_errors.append({
+                            "row_index": row_index,
+                            "errors": row_errors,
+                            "original_data": {
+                                name: values[position] for name, values in zip(source_columns, source_arrays)
+                            }
+                        })
                 
-                self.performance_stats["total_records_processed"] += 1
-            
-            # Calculate processing time
-            processing_time = (datetime.now() - start_time).total_seconds()
-            self.performance_stats["average_processing_time"] = processing_time / len(df) if len(df) > 0 else 0
+                _log_error_summary("Field validation raised", field_errors)
             
-            # Prepare result
-            result = {
-                "mapped_data": mapped_data,
-                "processing_metadata": {
-                    "total_records_processed": len(df),
-                    "successful_records": len(mapped_data),
-                    "failed_records": len(validation_errors),
-                    "success_rate": (len(mapped_data) / len(df)) * 100 if len(df) > 0 else 0,
-                    "processing_time_seconds": processing_time,
-                    "performance_stats": self.performance_stats.copy()
-                },
-                "validation_errors": validation_errors,
-                "erp_endpoint": erp_endpoint
-            }
+            # Valid rows stay columnar; row dicts are only built when the caller wants them
+            mapped_frame = transformed.iloc[row_is_valid]
+            mapped_data = mapped_frame.to_dict('records') if records else mapped_frame
+            self.performance_stats["total_records_processed"] += len(df)
             
-            logger.info(f"Mapping completed: {len(mapped_data)}/{len(df)} records successful")
-            return result
+            return self._mapping_result(df, mapped_data, validation_errors, time.perf_counter_ns() - start_time, erp_endpoint)
             
         except Exception as e:
             logger.error(f"Mapping process failed: {e}")
             raise MappingError(f"Mapping process failed: {str(e)}")
+    
+    def apply_mapping_iter(self, df: pd.DataFrame, mapping_config: Dict[str, Any], chunk_size: int = 10_000,
+                           records: bool = True, use_gpu: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Apply a mapping in row groups, yielding one ``apply_mapping`` result per group
+        
+        Only one group's mapped rows are held at a time, so a caller can post each
+        batch to the ERP while the next one is being mapped.
+        
+        Args:
+            df: Input DataFrame
+            mapping_config: Mapping configuration
+            chunk_size: Maximum rows per group
+            records: Passed through to ``apply_mapping``
+            use_gpu: Passed through to ``apply_mapping``
+            
+        Yields:
+            Result dicts shaped like ``apply_mapping``'s, covering consecutive rows
+        """
+        if chunk_size < 1:
+            raise MappingError(f"chunk_size must be positive, got {chunk_size}")
+        for start in range(0, len(df), chunk_size):
+            yield self.apply_mapping(df.iloc[start:start + chunk_size], mapping_config, records=records,
+                                     parallel=False, use_gpu=use_gpu)
+
+def _map_chunk(engine: MappingEngine, df_chunk: pd.DataFrame, mapping_config: Dict[str, Any],
+               records: bool) -> Dict[str, Any]:
+    """Process pool entry point: map one row group with the worker's copy of the engine"""
+    return engine.apply_mapping(df_chunk, mapping_config, records=records, parallel=False)
 
 # Global mapping engine instance
 mapping_engine = MappingEngine()
@@ -1,5 +1,11 @@
+import os
 import re
+import copy
+import math
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, date
 from typing import Dict, Any, List, Optional, Callable, Union
 from enum import Enum
@@ -7,16 +13,116 @@ from decimal import Decimal, InvalidOperation
 import phonenumbers
 from email_validator import validate_email, EmailNotValidError
 import pandas as pd
+import numpy as np
 
 from .models import ERPNextEndpoint, ERPNextDocStatus
+from .kernels import numeric_range_flags
 
 logger = logging.getLogger(__name__)
 
+# Matched with fullmatch, so the patterns carry no ^/$ anchors; code
+# lengths (3-50) are part of the patterns
+_RE_CUSTOMER_CODE = re.compile(r'[a-zA-Z0-9_-]{3,50}')
+_RE_ITEM_CODE = re.compile(r'[a-zA-Z0-9-]{3,50}')
+_RE_ALPHANUMERIC = re.compile(r'[a-zA-Z0-9]+')
+_RE_PHONE_FALLBACK = re.compile(r'\+?[1-9]\d{1,14}|[0-9\s\-\+\(\)]{7,20}')
+# Cheap shape check run before email_validator; rejects nothing it would accept
+_RE_EMAIL_SHAPE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+# Set RANGOON_SKIP_VALIDATION=true to trust pre-cleaned imports and skip the
+# customer/item validators entirely (see also their per-call ``validate`` flag)
+VALIDATION_ENABLED = os.getenv("RANGOON_SKIP_VALIDATION", "").strip().lower() not in ("1", "true", "yes")
+
+# Marks a rule or constraint that is not set
+_MISSING = object()
+
+# Values accepted by the ERPNext choice rules, stored casefolded and compared
+# against strip().casefold() of the input
+_VALID_UOMS = frozenset(name.casefold() for name in (
+    'Nos', 'Kg', 'Gram', 'Meter', 'Box', 'Packet', 'Set', 'Pair',
+    'Hour', 'Day', 'Month', 'Year', 'Liter', 'Piece', 'Unit'
+))
+_VALID_TERRITORIES = frozenset(name.casefold() for name in (
+    'Myanmar', 'All Territories', 'Rest Of The World'
+))
+_VALID_CUSTOMER_GROUPS = frozenset(name.casefold() for name in (
+    'Individual', 'Company', 'Government', 'Educational Institution',
+    'Commercial Customer', 'All Customer Groups'
+))
+_VALID_ITEM_GROUPS = frozenset(name.casefold() for name in (
+    'Products', 'Raw Material', 'Services', 'Sub Assemblies',
+    'Consumable', 'All Item Groups'
+))
+
+# Rule config given as a bare flag (``"email": True``) rather than parameters
+_NO_PARAM = object()
+# Schemas whose compiled plan each Validator keeps (see Validator.schema_plan)
+_PLAN_CACHE_SIZE = 128
+# Code rules that validate_frame checks with one regex over the whole column
+_CODE_PATTERNS = {
+    "erpnext_customer_code": _RE_CUSTOMER_CODE,
+    "erpnext_item_code": _RE_ITEM_CODE,
+}
+
+@lru_cache(maxsize=256)
+def _rule_pattern(pattern: str) -> re.Pattern:
+    """Compile (and cache) a regex taken from validation rules"""
+    return re.compile(pattern)
+
+# strptime formats accepted by _is_date_string besides ISO 8601
+_DATE_FORMATS = (
+    '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d',
+    '%m-%d-%Y', '%d-%m-%Y', '%Y.%m.%d', '%d.%m.%Y',
+    '%b %d, %Y', '%B %d, %Y'
+)
+# Order _is_date_string tries them in (None: datetime.fromisoformat). The last
+# format that matched moves to the front, so a column of, say, US dates stops
+# paying for an ISO miss and the formats before it on every value.
+_date_format_order: tuple = (None,) + _DATE_FORMATS
+
+def _parse_date_string(text: str, fmt: Optional[str]) -> datetime:
+    if fmt is None:
+        return datetime.fromisoformat(text.replace('Z', '+00:00') if 'Z' in text else text)
+    return datetime.strptime(text, fmt)
+
+@lru_cache(maxsize=4096)
+def _is_date_string(text: str) -> bool:
+    """Whether ``text`` parses as ISO 8601 or one of _DATE_FORMATS (imports repeat dates a lot)"""
+    global _date_format_order
+    order = _date_format_order
+    for fmt in order:
+        try:
+            _parse_date_string(text, fmt)
+        except ValueError:
+            continue
+        if fmt != order[0]:
+            _date_format_order = (fmt,) + tuple(f for f in order if f != fmt)
+        return True
+    
+    return False
+
+@lru_cache(maxsize=4096)
+def _is_phone_string(text: str) -> bool:
+    """phonenumbers validation with the regex fallback for numbers it cannot parse"""
+    # Without a (full-width) plus there is no country code, and parse(text, None)
+    # always fails, so skip straight to the fallback
+    if '+' not in text and '\uff0b' not in text:
+        return bool(_RE_PHONE_FALLBACK.fullmatch(text))
+    try:
+        return phonenumbers.is_valid_number(phonenumbers.parse(text, None))
+    except phonenumbers.NumberParseException:
+        return bool(_RE_PHONE_FALLBACK.fullmatch(text))
+
 class ValidationSeverity(Enum):
     ERROR = "error"
     WARNING = "warning"
     INFO = "info"
 
+# Severity strings as stored in result dicts, bound once instead of per entry
+_SEV_ERROR = ValidationSeverity.ERROR.value
+_SEV_WARNING = ValidationSeverity.WARNING.value
+_SEV_INFO = ValidationSeverity.INFO.value
+
 class ValidationResult:
     """Structured validation result"""
     
@@ -25,6 +131,13 @@ class ValidationResult:
         self.errors: List[Dict[str, Any]] = []
         self.warnings: List[Dict[str, Any]] = []
         self.info: List[Dict[str, Any]] = []
+        self._timestamp: Optional[str] = None
+    
+    def _now(self) -> str:
+        """Timestamp shared by every entry of this result, taken on the first one"""
+        if self._timestamp is None:
+            self._timestamp = datetime.now().isoformat()
+        return self._timestamp
     
     def add_error(self, field: str, message: str, value: Any = None, rule: str = None):
         """Add validation error"""
@@ -34,8 +147,8 @@ class ValidationResult:
             "message": message,
             "value": value,
             "rule": rule,
-            "severity": ValidationSeverity.ERROR.value,
-            "timestamp": datetime.now().isoformat()
+            "severity": _SEV_ERROR,
+            "timestamp": self._now()
         })
     
     def add_warning(self, field: str, message: str, value: Any = None, rule: str = None):
@@ -45,8 +158,8 @@ class ValidationResult:
             "message": message,
             "value": value,
             "rule": rule,
-            "severity": ValidationSeverity.WARNING.value,
-            "timestamp": datetime.now().isoformat()
+            "severity": _SEV_WARNING,
+            "timestamp": self._now()
         })
     
     def add_info(self, field: str, message: str, value: Any = None):
@@ -55,8 +168,8 @@ class ValidationResult:
             "field": field,
             "message": message,
             "value": value,
-            "severity": ValidationSeverity.INFO.value,
-            "timestamp": datetime.now().isoformat()
+            "severity": _SEV_INFO,
+            "timestamp": self._now()
         })
     
     def to_dict(self) -> Dict[str, Any]:
@@ -89,6 +202,8 @@ class ValidationRule:
         self.validator = validator
         self.message = message
         self.severity = severity
+        # Plain string compared on hot paths instead of the Enum member
+        self.severity_value = severity.value if isinstance(severity, ValidationSeverity) else severity
     
     def validate(self, value: Any, field: str = None) -> Optional[Dict[str, Any]]:
         """Validate value against rule"""
@@ -99,7 +214,7 @@ class ValidationRule:
                     "message": self.message,
                     "value": value,
                     "rule": self.name,
-                    "severity": self.severity.value
+                    "severity": self.severity_value
                 }
         except Exception as e:
             return {
@@ -107,7 +222,7 @@ class ValidationRule:
                 "message": f"Validation error: {str(e)}",
                 "value": value,
                 "rule": self.name,
-                "severity": ValidationSeverity.ERROR.value
+                "severity": _SEV_ERROR
             }
         return None
 
@@ -116,6 +231,9 @@ class Validator:
     
     def __init__(self):
         self.rules: Dict[str, ValidationRule] = {}
+        # id(schema) -> (schema, snapshot, plan), dropped whenever a rule is registered
+        self._plans: OrderedDict = OrderedDict()
+        self._plans_lock = threading.Lock()
         self._initialize_builtin_rules()
         self._initialize_erpnext_rules()
     
@@ -206,6 +324,9 @@ class Validator:
                      severity: ValidationSeverity = ValidationSeverity.ERROR):
         """Register custom validation rule"""
         self.rules[name] = ValidationRule(name, validator, message, severity)
+        # Compiled plans hold the rule objects they were built with
+        with self._plans_lock:
+            self._plans.clear()
         logger.info(f"Registered validation rule: {name}")
     
     def validate_field(self, value: Any, field: str, rules: Dict[str, Any]) -> ValidationResult:
@@ -215,6 +336,7 @@ class Validator:
         for rule_name, rule_config in rules.items():
             if rule_name in self.rules:
                 rule = self.rules[rule_name]
+                severity = rule.severity_value
                 
                 # Handle parameterized rules
                 if isinstance(rule_config, dict):
@@ -230,34 +352,91 @@ class Validator:
                         
                         error = custom_rule.validate(value, field)
                         if error:
-                            if rule.severity == ValidationSeverity.ERROR:
+                            if severity == _SEV_ERROR:
                                 result.add_error(field, error["message"], value, full_rule_name)
-                            elif rule.severity == ValidationSeverity.WARNING:
+                            elif severity == _SEV_WARNING:
                                 result.add_warning(field, error["message"], value, full_rule_name)
                 else:
                     # Simple rules without parameters
                     error = rule.validate(value, field)
                     if error:
-                        if rule.severity == ValidationSeverity.ERROR:
+                        if severity == _SEV_ERROR:
                             result.add_error(field, error["message"], value, rule_name)
-                        elif rule.severity == ValidationSeverity.WARNING:
+                        elif severity == _SEV_WARNING:
                             result.add_warning(field, error["message"], value, rule_name)
         
         return result
     
     def validate_object(self, data: Dict[str, Any], validation_schema: Dict[str, Any]) -> ValidationResult:
         """Validate entire object against schema"""
-        result = ValidationResult()
+        return self.validate_plan(data, self.schema_plan(validation_schema))
+    
+    def schema_plan(self, validation_schema: Dict[str, Any]) -> List[tuple]:
+        """
+        compile_schema, cached per schema object
         
+        A plan is reused until the schema is changed in place or a rule is
+        registered; the most recently used schemas are kept.
+        """
+        key = id(validation_schema)
+        with self._plans_lock:
+            cached = self._plans.get(key)
+            if cached is not None and cached[0] is validation_schema and cached[1] == validation_schema:
+                self._plans.move_to_end(key)
+                return cached[2]
+        plan = self.compile_schema(validation_schema)
+        with self._plans_lock:
+            # Holding the schema keeps its id from being reused while cached
+            self._plans[key] = (validation_schema, copy.deepcopy(validation_schema), plan)
+            self._plans.move_to_end(key)
+            if len(self._plans) > _PLAN_CACHE_SIZE:
+                self._plans.popitem(last=False)
+        return plan
+    
+    def compile_schema(self, validation_schema: Dict[str, Any]) -> List[tuple]:
+        """
+        Resolve a schema to ``(field, rule_name, param, rule)`` steps
+        
+        Parameterized rules are bound once here instead of on every validated
+        record; schema_plan caches the result per schema for validate_plan.
+        """
+        plan = []
         for field, rules in validation_schema.items():
-            value = data.get(field)
-            field_result = self.validate_field(value, field, rules)
-            result.merge(field_result)
+            for rule_name, rule_config in rules.items():
+                rule = self.rules.get(rule_name)
+                if rule is None:
+                    continue
+                if isinstance(rule_config, dict):
+                    # Rules with parameters (e.g., min_length: 5)
+                    for param_name, param_value in rule_config.items():
+                        plan.append((field, rule_name, param_value, ValidationRule(
+                            f"{rule_name}_{param_name}",
+                            self._create_parameterized_validator(rule.validator, param_name, param_value),
+                            rule.message, rule.severity
+                        )))
+                else:
+                    plan.append((field, rule_name, _NO_PARAM, rule))
+        return plan
+    
+    def validate_plan(self, data: Dict[str, Any], plan: List[tuple]) -> ValidationResult:
+        """Validate an object against a plan built by compile_schema"""
+        result = ValidationResult()
+        get = data.get
+        
+        for field, _, _, rule in plan:
+            value = get(field)
+            error = rule.validate(value, field)
+            if error:
+                severity = rule.severity_value
+                if severity == _SEV_ERROR:
+                    result.add_error(field, error["message"], value, rule.name)
+                elif severity == _SEV_WARNING:
+                    result.add_warning(field, error["message"], value, rule.name)
         
         return result
     
     def validate_dataframe(self, df: pd.DataFrame, validation_schema: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate pandas DataFrame against schema"""
+        """Validate pandas DataFrame against schema, rule by rule over whole columns (see validate_frame)"""
         results = {
             "valid_rows": [],
             "invalid_rows": [],
@@ -270,10 +449,8 @@ class Validator:
             }
         }
         
-        for index, row in df.iterrows():
-            row_data = row.to_dict()
-            validation_result = self.validate_object(row_data, validation_schema)
-            
+        validations = self.validate_frame(df, [validation_schema], missing_as_none=False)
+        for index, row_data, validation_result in zip(df.index.tolist(), df.to_dict("records"), validations):
             row_result = {
                 "row_index": index,
                 "data": row_data,
@@ -292,6 +469,83 @@ class Validator:
         
         return results
     
+    def validate_frame(self, df: pd.DataFrame, schemas: List[Dict[str, Any]],
+                       missing_as_none: bool = True) -> List[ValidationResult]:
+        """
+        Validate every row of a DataFrame against one or more schemas
+        
+        Equivalent to validate_object per row (results of the schemas merged in
+        order), but each rule first runs once over its whole column to find the
+        rows that may fail; only those cells are checked one at a time. Missing
+        cells (NaN/None) are validated as None unless ``missing_as_none`` is False.
+        """
+        results = [ValidationResult() for _ in range(len(df))]
+        columns: Dict[str, tuple] = {}
+        
+        for schema in schemas:
+            for field, rule_name, param, rule in self.schema_plan(schema):
+                if field not in columns:
+                    if field in df.columns:
+                        column = df[field]
+                    else:
+                        column = pd.Series(None, index=df.index, dtype=object)
+                    if missing_as_none or field not in df.columns:
+                        missing = column.isna().to_numpy(dtype=bool)
+                    else:
+                        missing = np.fromiter((value is None for value in column.tolist()), dtype=bool, count=len(column))
+                    columns[field] = (column, missing, column.to_numpy(dtype=object))
+                column, missing, values = columns[field]
+                
+                candidates = self._rule_candidates(column, missing, rule_name, param, rule)
+                if not candidates.any():
+                    continue
+                messages: Dict[Any, Optional[str]] = {}
+                severity = rule.severity_value
+                for i in np.flatnonzero(candidates).tolist():
+                    value = None if missing[i] else values[i]
+                    message = _cached_rule_message(rule, value, field, messages)
+                    if message is not None:
+                        if severity == _SEV_ERROR:
+                            results[i].add_error(field, message, value, rule.name)
+                        elif severity == _SEV_WARNING:
+                            results[i].add_warning(field, message, value, rule.name)
+        
+        return results
+    
+    def _rule_candidates(self, column: pd.Series, missing: np.ndarray, rule_name: str,
+                         param: Any, check: ValidationRule) -> np.ndarray:
+        """Rows of ``column`` that may fail a rule (a superset, confirmed per cell by validate_frame)"""
+        if param is _NO_PARAM:
+            if rule_name == "required":
+                return missing | (column == "").to_numpy(dtype=bool)
+            if rule_name in _CODE_PATTERNS:
+                ok = column.astype(str).str.strip().str.fullmatch(_CODE_PATTERNS[rule_name]).astype(bool)
+                return missing | ~ok.to_numpy(dtype=bool)
+        elif rule_name in ("min_length", "max_length") and isinstance(param, int):
+            lengths = column.astype(str).str.len().to_numpy()
+            if rule_name == "min_length":
+                return missing | (lengths < param)
+            return ~missing & (lengths > param)
+        elif rule_name in ("min_value", "max_value") and isinstance(param, (int, float)):
+            try:
+                numbers = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+            except (TypeError, ValueError):
+                numbers = None
+            if numbers is not None:
+                with np.errstate(invalid='ignore'):
+                    outside = numbers < param if rule_name == "min_value" else numbers > param
+                return ~missing & (np.isnan(numbers) | outside)
+        
+        # Everything else (email, phone, dates, lists...): run the rule once per distinct value
+        messages: Dict[Any, Optional[str]] = {}
+        fails = np.zeros(len(column), dtype=bool)
+        if missing.any():
+            fails[missing] = _cached_rule_message(check, None, None, messages) is not None
+        for i, value in enumerate(column.tolist()):
+            if not missing[i]:
+                fails[i] = _cached_rule_message(check, value, None, messages) is not None
+        return fails
+    
     def _create_parameterized_validator(self, base_validator: Callable, param_name: str, param_value: Any) -> Callable:
         """Create parameterized validator function"""
         def parameterized_validator(value: Any) -> bool:
@@ -304,24 +558,16 @@ class Validator:
         if value is None:
             return False
         
-        code = str(value).strip()
-        if len(code) < 3 or len(code) > 50:
-            return False
-        
-        # Alphanumeric with hyphens and underscores allowed
-        return bool(re.match(r'^[a-zA-Z0-9_-]+$', code))
+        # 3-50 letters, digits, hyphens and underscores
+        return bool(_RE_CUSTOMER_CODE.fullmatch(str(value).strip()))
     
     def _validate_erpnext_item_code(self, value: Any) -> bool:
         """Validate ERPNext item code format"""
         if value is None:
             return False
         
-        code = str(value).strip()
-        if len(code) < 3 or len(code) > 50:
-            return False
-        
-        # Alphanumeric with hyphens allowed
-        return bool(re.match(r'^[a-zA-Z0-9-]+$', code))
+        # 3-50 letters, digits and hyphens
+        return bool(_RE_ITEM_CODE.fullmatch(str(value).strip()))
     
     def _validate_erpnext_quantity(self, value: Any) -> bool:
         """Validate ERPNext quantity"""
@@ -350,47 +596,28 @@ class Validator:
         if value is None:
             return True  # Default will be applied
         
-        valid_uoms = [
-            'Nos', 'Kg', 'Gram', 'Meter', 'Box', 'Packet', 'Set', 'Pair',
-            'Hour', 'Day', 'Month', 'Year', 'Liter', 'Piece', 'Unit'
-        ]
-        
-        return str(value).strip().title() in valid_uoms
+        return str(value).strip().casefold() in _VALID_UOMS
     
     def _validate_erpnext_territory(self, value: Any) -> bool:
         """Validate ERPNext territory"""
         if value is None:
             return True  # Default will be applied
         
-        valid_territories = [
-            'Myanmar', 'All Territories', 'Rest Of The World'
-        ]
-        
-        return str(value).strip().title() in valid_territories
+        return str(value).strip().casefold() in _VALID_TERRITORIES
     
     def _validate_erpnext_customer_group(self, value: Any) -> bool:
         """Validate ERPNext customer group"""
         if value is None:
             return True  # Default will be applied
         
-        valid_groups = [
-            'Individual', 'Company', 'Government', 'Educational Institution',
-            'Commercial Customer', 'All Customer Groups'
-        ]
-        
-        return str(value).strip().title() in valid_groups
+        return str(value).strip().casefold() in _VALID_CUSTOMER_GROUPS
     
     def _validate_erpnext_item_group(self, value: Any) -> bool:
         """Validate ERPNext item group"""
         if value is None:
             return True  # Default will be applied
         
-        valid_groups = [
-            'Products', 'Raw Material', 'Services', 'Sub Assemblies',
-            'Consumable', 'All Item Groups'
-        ]
-        
-        return str(value).strip().title() in valid_groups
+        return str(value).strip().casefold() in _VALID_ITEM_GROUPS
     
     # Built-in validator methods (unchanged)
     def _validate_required(self, value: Any) -> bool:
@@ -425,13 +652,13 @@ class Validator:
         """Validate against regex pattern"""
         if value is None:
             return True
-        return bool(re.match(pattern, str(value)))
+        return bool(_rule_pattern(pattern).match(str(value)))
     
     def _validate_alphanumeric(self, value: Any) -> bool:
         """Validate alphanumeric characters only"""
         if value is None:
             return True
-        return bool(re.match(r'^[a-zA-Z0-9]+$', str(value)))
+        return bool(_RE_ALPHANUMERIC.fullmatch(str(value)))
     
     def _validate_numeric(self, value: Any) -> bool:
         """Validate numeric value"""
@@ -492,25 +719,7 @@ class Validator:
         if isinstance(value, (datetime, date)):
             return True
         
-        try:
-            datetime.fromisoformat(str(value).replace('Z', '+00:00'))
-            return True
-        except ValueError:
-            pass
-        
-        date_formats = [
-            '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d',
-            '%m-%d-%Y', '%d-%m-%Y', '%Y.%m.%d', '%d.%m.%Y',
-            '%b %d, %Y', '%B %d, %Y' ]
-        
-        for fmt in date_formats:
-            try:
-                datetime.strptime(str(value), fmt)
-                return True
-            except ValueError:
-                continue
-        
-        return False
+        return _is_date_string(str(value))
     
     def _validate_min_date(self, value: Any, min_date: str) -> bool:
         """Validate minimum date"""
@@ -545,12 +754,15 @@ class Validator:
             return False
     
     def _validate_email(self, value: Any) -> bool:
-        """Validate email format using email-validator library"""
+        """Validate email format using email-validator library (syntax only, no DNS lookups)"""
         if value is None:
             return True
         
+        text = str(value)
+        if not _RE_EMAIL_SHAPE.fullmatch(text):
+            return False
         try:
-            validate_email(str(value))
+            validate_email(text, check_deliverability=False)
             return True
         except EmailNotValidError:
             return False
@@ -560,12 +772,7 @@ class Validator:
         if value is None:
             return True
         
-        try:
-            phone_number = phonenumbers.parse(str(value), None)
-            return phonenumbers.is_valid_number(phone_number)
-        except phonenumbers.NumberParseException:
-            pattern = r'^\+?[1-9]\d{1,14}$|^[0-9\s\-\+\(\)]{7,20}$'
-            return bool(re.match(pattern, str(value)))
+        return _is_phone_string(str(value))
     
     def _validate_unique(self, value: Any, existing_values: List) -> bool:
         """Validate unique value"""
@@ -586,6 +793,23 @@ class Validator:
         return value not in disallowed_list
 
 # Domain-specific validators
+
+# Checked for every line of a sales order/invoice
+_SALES_ITEM_SCHEMA = {
+    "item_code": {
+        "required": True,
+        "min_length": {"value": 3}
+    },
+    "qty": {
+        "required": True,
+        "erpnext_quantity": True
+    },
+    "rate": {
+        "required": True,
+        "erpnext_rate": True
+    }
+}
+
 class ERPNextValidator:
     """ERPNext specific data validator"""
     
@@ -686,8 +910,8 @@ class ERPNextValidator:
     
     def validate_for_endpoint(self, data: Dict[str, Any], endpoint: ERPNextEndpoint) -> ValidationResult:
         """Validate data for specific ERPNext endpoint"""
-        schema = self.schemas.get(endpoint, {})
-        return self.validator.validate_object(data, schema)
+        schema = self.schemas.get(endpoint)
+        return self.validator.validate_plan(data, self.validator.schema_plan(schema) if schema else [])
     
     def validate_sales_order_items(self, items: List[Dict[str, Any]]) -> ValidationResult:
         """Validate sales order/invoice items"""
@@ -698,20 +922,7 @@ class ERPNextValidator:
             return result
         
         for index, item in enumerate(items):
-            item_result = self.validator.validate_object(item, {
-                "item_code": {
-                    "required": True,
-                    "min_length": {"value": 3}
-                },
-                "qty": {
-                    "required": True,
-                    "erpnext_quantity": True
-                },
-                "rate": {
-                    "required": True,
-                    "erpnext_rate": True
-                }
-            })
+            item_result = self.validator.validate_plan(item, self.validator.schema_plan(_SALES_ITEM_SCHEMA))
             
             if not item_result.is_valid:
                 for error in item_result.errors:
@@ -793,10 +1004,13 @@ class CustomerValidator:
             }
         }
     
-    def validate_customer(self, customer_data: Dict[str, Any]) -> ValidationResult:
-        """Validate customer data for ERPNext"""
+    def validate_customer(self, customer_data: Dict[str, Any], validate: bool = True) -> ValidationResult:
+        """Validate customer data for ERPNext (``validate=False`` trusts it as is)"""
+        if not (validate and VALIDATION_ENABLED):
+            return ValidationResult()
+        
         # Basic validation
-        basic_result = self.validator.validate_object(customer_data, self.schema)
+        basic_result = self.validator.validate_plan(customer_data, self.validator.schema_plan(self.schema))
         
         # ERPNext specific validation
         erpnext_result = self.erpnext_validator.validate_for_endpoint(
@@ -807,7 +1021,7 @@ class CustomerValidator:
         basic_result.merge(erpnext_result)
         return basic_result
     
-    def validate_customers_batch(self, customers: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def validate_customers_batch(self, customers: List[Dict[str, Any]], validate: bool = True) -> Dict[str, Any]:
         """Validate batch of customers for ERPNext"""
         results = {
             "valid_customers": [],
@@ -820,7 +1034,7 @@ class CustomerValidator:
         }
         
         for customer in customers:
-            validation_result = self.validate_customer(customer)
+            validation_result = self.validate_customer(customer, validate)
             
             customer_result = {
                 "data": customer,
@@ -837,6 +1051,16 @@ class CustomerValidator:
         
         return results
 
+    def validate_customers_frame(self, df: pd.DataFrame, validate: bool = True) -> Dict[str, Any]:
+        """Validate a DataFrame of customers for ERPNext, one vectorized pass per rule"""
+        if validate and VALIDATION_ENABLED:
+            validations = self.validator.validate_frame(
+                df, [self.schema, self.erpnext_validator.schemas[ERPNextEndpoint.CUSTOMERS]]
+            )
+        else:
+            validations = [ValidationResult() for _ in range(len(df))]
+        return _frame_batch_results(df, validations, "valid_customers", "invalid_customers")
+
 class ItemValidator:
     """Item data validator for ERPNext"""
     
@@ -861,9 +1085,12 @@ class ItemValidator:
             }
         }
     
-    def validate_item(self, item_data: Dict[str, Any]) -> ValidationResult:
-        """Validate item data for ERPNext"""
-        basic_result = self.validator.validate_object(item_data, self.schema)
+    def validate_item(self, item_data: Dict[str, Any], validate: bool = True) -> ValidationResult:
+        """Validate item data for ERPNext (``validate=False`` trusts it as is)"""
+        if not (validate and VALIDATION_ENABLED):
+            return ValidationResult()
+        
+        basic_result = self.validator.validate_plan(item_data, self.validator.schema_plan(self.schema))
         erpnext_result = self.erpnext_validator.validate_for_endpoint(
             item_data, ERPNextEndpoint.ITEMS
         )
@@ -871,6 +1098,190 @@ class ItemValidator:
         basic_result.merge(erpnext_result)
         return basic_result
 
+    def validate_items_frame(self, df: pd.DataFrame, validate: bool = True) -> Dict[str, Any]:
+        """Validate a DataFrame of items for ERPNext, one vectorized pass per rule"""
+        if validate and VALIDATION_ENABLED:
+            validations = self.validator.validate_frame(
+                df, [self.schema, self.erpnext_validator.schemas[ERPNextEndpoint.ITEMS]]
+            )
+        else:
+            validations = [ValidationResult() for _ in range(len(df))]
+        return _frame_batch_results(df, validations, "valid_items", "invalid_items")
+
+def _cached_rule_message(check: ValidationRule, value: Any, field: Optional[str],
+                         messages: Dict[Any, Optional[str]]) -> Optional[str]:
+    """Error message of ``check`` for ``value`` (None if it passes), memoized per (type, value)"""
+    try:
+        key = (type(value), value)
+        if key in messages:
+            return messages[key]
+    except TypeError:  # unhashable cell
+        error = check.validate(value, field)
+        return error["message"] if error else None
+    error = check.validate(value, field)
+    messages[key] = message = error["message"] if error else None
+    return message
+
+def _frame_batch_results(df: pd.DataFrame, validations: List[ValidationResult],
+                         valid_key: str, invalid_key: str) -> Dict[str, Any]:
+    """Shape validate_frame results like the list-based *_batch methods"""
+    results = {
+        valid_key: [],
+        invalid_key: [],
+        "summary": {
+            "total": len(df),
+            "valid": 0,
+            "invalid": 0
+        }
+    }
+    
+    for row_index, record, validation_result in zip(df.index.tolist(), df.to_dict("records"), validations):
+        record_result = {
+            "row_index": row_index,
+            "data": record,
+            "validation": validation_result.to_dict()
+        }
+        
+        if validation_result.is_valid:
+            results[valid_key].append(record_result)
+        else:
+            results[invalid_key].append(record_result)
+    
+    results["summary"]["valid"] = len(results[valid_key])
+    results["summary"]["invalid"] = len(results[invalid_key])
+    
+    return results
+
+def _is_blank(value: Any) -> bool:
+    """None, NaN or a whitespace-only string"""
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    return isinstance(value, float) and value != value
+
+def _as_number(value: Any) -> Optional[float]:
+    """float(value), or None when float() cannot read it or reads it as NaN"""
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return None
+    return None if math.isnan(number) else number
+
+def _numeric_bounds(constraints: Dict[str, Any]) -> tuple:
+    """The ``min`` and ``max`` of a value constraint as floats, None where unset
+    
+    Raises ValueError for a bound that is not a number.
+    """
+    bounds = []
+    for key in ("min", "max"):
+        bound = constraints.get(key)
+        number = None if bound is None else _as_number(bound)
+        if bound is not None and number is None:
+            raise ValueError(f"{key} bound {bound!r} is not a number")
+        bounds.append(number)
+    return tuple(bounds)
+
+def validate_business_rules(data: Dict[str, Any], business_rules: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Check one mapped record against a mapping's business rules
+    
+    Args:
+        data: Mapped record
+        business_rules: ``required_fields`` (list of field names) and
+            ``value_constraints`` ({field: {"min", "max", "allowed_values"}})
+        
+    Returns:
+        Dict with ``is_valid``, ``errors``, ``warnings`` and ``validated_data``
+    """
+    if not VALIDATION_ENABLED:
+        return {"is_valid": True, "errors": [], "warnings": [], "validated_data": data}
+    
+    errors: List[str] = [
+        f"Required field '{field}' is missing or empty"
+        for field in business_rules.get("required_fields", []) if _is_blank(data.get(field))
+    ]
+    warnings: List[str] = []
+    
+    for field, constraints in business_rules.get("value_constraints", {}).items():
+        value = data.get(field, _MISSING)
+        if value is _MISSING:
+            warnings.append(f"Constrained field '{field}' is not in the record")
+            continue
+        if _is_blank(value):
+            continue  # Left to required_fields
+        
+        allowed_values = constraints.get("allowed_values", _MISSING)
+        
+        if "min" in constraints or "max" in constraints:
+            try:
+                min_value, max_value = _numeric_bounds(constraints)
+            except ValueError as e:
+                errors.append(f"Field '{field}' has an invalid constraint: {e}")
+                continue
+            number = _as_number(value)
+            if number is None:
+                errors.append(f"Field '{field}' value {value!r} is not a number")
+                continue
+            if min_value is not None and number < min_value:
+                errors.append(f"Field '{field}' value {value} is below minimum {constraints['min']}")
+            if max_value is not None and number > max_value:
+                errors.append(f"Field '{field}' value {value} is above maximum {constraints['max']}")
+        
+        if allowed_values is not _MISSING and value not in allowed_values:
+            errors.append(f"Field '{field}' value {value!r} is not one of the allowed values")
+    
+    return {
+        "is_valid": not errors,
+        "errors": errors,
+        "warnings": warnings,
+        "validated_data": data
+    }
+
+def validate_business_rules_batch(records: List[Dict[str, Any]], business_rules: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    validate_business_rules for many records, with numeric min/max bounds
+    checked for a whole field at once by the (numba when installed)
+    numeric_range_flags kernel
+    
+    Records whose bounded values are all in range and numeric are validated
+    without their min/max constraints; the rest take the per-record path,
+    so results match validate_business_rules exactly.
+    """
+    constraints = business_rules.get("value_constraints", {})
+    bounded = {
+        field: field_constraints for field, field_constraints in constraints.items()
+        if "min" in field_constraints or "max" in field_constraints
+    }
+    if not VALIDATION_ENABLED or not bounded or not records:
+        return [validate_business_rules(record, business_rules) for record in records]
+    
+    needs_bounds = np.zeros(len(records), dtype=bool)
+    for field, field_constraints in bounded.items():
+        try:
+            min_value, max_value = _numeric_bounds(field_constraints)
+        except ValueError:
+            needs_bounds[:] = True  # validate_business_rules reports the bad bound
+            continue
+        values = [record.get(field) for record in records]
+        numbers = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=float)
+        flags = numeric_range_flags(numbers, min_value, max_value)
+        not_numeric = np.isnan(numbers) & ~np.fromiter(map(_is_blank, values), dtype=bool, count=len(values))
+        needs_bounds |= (flags != 0) | not_numeric
+    
+    unbounded_rules = {
+        **business_rules,
+        "value_constraints": {
+            field: {key: value for key, value in field_constraints.items() if key not in ("min", "max")}
+            if field in bounded else field_constraints
+            for field, field_constraints in constraints.items()
+        }
+    }
+    return [
+        validate_business_rules(record, business_rules if flagged else unbounded_rules)
+        for record, flagged in zip(records, needs_bounds.tolist())
+    ]
+
 # Global validator instances
 validator = Validator()
 erpnext_validator = ERPNextValidator()
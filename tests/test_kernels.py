@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from app.utils import kernels
+from app.utils.kernels import RANGE_ABOVE_MAX, RANGE_BELOW_MIN, numeric_range_flags, round_clip_nonneg
+
+VALUES = np.array([-1.5, -0.0, 0.0, 0.004, 0.005, 1.234, 2.5, 99.999, np.nan, np.inf, -np.inf, 1e300])
+
+
+def test_round_clip_nonneg_clips_negatives_and_nan():
+    out = round_clip_nonneg(np.array([-3.0, np.nan, 0.0, 1.236, np.inf]), 2)
+    assert out.tolist() == [0.0, 0.0, 0.0, 1.24, np.inf]
+
+
+@pytest.mark.parametrize("decimals", [0, 2, 3])
+def test_round_clip_nonneg_matches_numpy_fallback(decimals, monkeypatch):
+    compiled = round_clip_nonneg(VALUES, decimals)
+    monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", False)
+    np.testing.assert_array_equal(compiled, round_clip_nonneg(VALUES, decimals))
+
+
+def test_numeric_range_flags_bits():
+    flags = numeric_range_flags(np.array([-1.0, 0.0, 5.0, 11.0, np.nan]), 0, 10)
+    assert flags.tolist() == [RANGE_BELOW_MIN, 0, 0, RANGE_ABOVE_MAX, 0]
+    assert numeric_range_flags(np.array([-1.0, 11.0]), None, 10).tolist() == [0, RANGE_ABOVE_MAX]
+    assert numeric_range_flags(np.array([-1.0, 11.0])).tolist() == [0, 0]
+
+
+@pytest.mark.parametrize("bounds", [(0, 10), (None, 1.5), (-np.inf, None), (2, 1)])
+def test_numeric_range_flags_matches_numpy_fallback(bounds, monkeypatch):
+    compiled = numeric_range_flags(VALUES, *bounds)
+    monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", False)
+    np.testing.assert_array_equal(compiled, numeric_range_flags(VALUES, *bounds))
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_kernels_accept_non_contiguous_input(use_numba, monkeypatch):
+    monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", kernels.NUMBA_AVAILABLE and use_numba)
+    values = np.arange(10, dtype=np.int64)[::2]
+    assert round_clip_nonneg(values, 0).tolist() == [0.0, 2.0, 4.0, 6.0, 8.0]
+    assert numeric_range_flags(values, 1, 7).tolist() == [RANGE_BELOW_MIN, 0, 0, 0, RANGE_ABOVE_MAX]
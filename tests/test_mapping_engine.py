@@ -0,0 +1,528 @@
+import math
+import warnings
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.utils.mapping_engine import MappingEngine, MappingError, VECTOR_OPS, DATE_VECTOR_OPS
+
+# Parameters for the transformations that need them
+PARAMETERS = {
+    "lookup": {"lookup_table": {"a": "A", "nan": "N", "None": "X", "1.5": "F"}, "default": "?"},
+    "round_decimal": {"decimals": 1},
+    "remove_special_chars": {"allowed_chars": "-"},
+}
+
+COLUMN_TRANSFORMATIONS = [
+    *VECTOR_OPS, "email_normalize", "phone_international", "erpnext_customer_code", "one_zero_to_boolean"
+]
+
+MISSING_COLUMNS = [
+    pd.Series([None, np.nan, "a", 1.5, "x"], dtype=object),
+    pd.Series([1.5, np.nan, 2.0]),
+]
+
+DATE_COLUMNS = [
+    pd.Series(["2020", "2020-01-01 10:00", "01/02/2020", " 2020-01-05 ", "Jan 05, 2020", "5 March 2021",
+               "2020-13-45", "31.12.2020", None, np.nan, "", "abc", 20200101, 1.0, 1, True, -0.0, 0.0,
+               pd.Timestamp("2021-03-04 05:06")], dtype=object),
+    pd.Series(pd.to_datetime(["2021-03-04", None, "2020-02-29"])),
+    pd.Series(["2020-01-01", "02/03/2021", None], dtype="string"),
+]
+
+NUMERIC_COLUMNS = [
+    pd.Series([None, np.nan, float("inf"), -float("inf"), 1e20, -1e20, 10**20, 2**63, -2**63, 0, -0.0, 1.5, -2.25,
+               2.675, " 3.5 ", "abc", "", "nan", "inf", "1e400", "12", "1_000", True, 9.99e15, 0.125], dtype=object),
+    pd.Series([1.5, np.nan, np.inf, -np.inf, 1e20, 2.675, 0.285, 1e300, -0.0]),
+    pd.Series(np.random.default_rng(0).uniform(-1000, 1000, 2000).round(3)),
+    # pd.to_numeric parses text less precisely than float()
+    pd.Series([repr(value) for value in np.random.default_rng(1).uniform(-1e6, 1e6, 2000)], dtype=object),
+]
+
+ERPNEXT_COLUMNS = [
+    pd.Series(["burma", " Kilogram ", "nan", "NaN", 0, 0.0, "", "  ", None, np.nan, "IN", "out", 1.5,
+               "Raw material", "MMR", "pieces", -3, "-2.5", "inf", "abc", True, False], dtype=object),
+    pd.Series([1.5, np.nan, -2.0, 0.0, np.inf]),
+]
+
+
+def same_value(a, b):
+    """Equality that also matches NaN with NaN and Decimals by their text"""
+    if a is b:
+        return True
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    if isinstance(a, Decimal) and isinstance(b, Decimal):
+        return str(a) == str(b)
+    return type(a) is type(b) and a == b
+
+
+def map_both_ways(column, transformations):
+    """Map a column per column, through compile_mapping and per row; returns the three value lists"""
+    engine = MappingEngine()
+    # An unknown-to-the-column-path transformation forces the chain into row mode
+    engine.register_custom_transformation("identity", lambda value: value)
+    df = pd.DataFrame({"src": column})
+    mapping = {"out": {"source_column": "src", "transformations": transformations}}
+    row_mapping = {"out": {"source_column": "src", "transformations": [*transformations, {"name": "identity"}]}}
+    by_column = engine.process_dataframe(df, mapping)["out"].tolist()
+    compiled = MappingEngine().compile_mapping(mapping)(df)["out"].tolist()
+    by_row = engine.process_dataframe(df, row_mapping)["out"].tolist()
+    return by_column, compiled, by_row
+
+
+def assert_modes_agree(column, transformations):
+    by_column, compiled, by_row = map_both_ways(column, transformations)
+    for value, vector_value, compiled_value, row_value in zip(column.tolist(), by_column, compiled, by_row):
+        assert same_value(vector_value, row_value), f"{transformations} on {value!r}: {vector_value!r} != {row_value!r}"
+        assert same_value(compiled_value, row_value), f"{transformations} on {value!r}: {compiled_value!r} != {row_value!r}"
+
+
+@pytest.mark.parametrize("name", COLUMN_TRANSFORMATIONS)
+@pytest.mark.parametrize("column", MISSING_COLUMNS)
+def test_column_mode_matches_row_mode_on_missing_values(name, column):
+    """None and NaN map the same whether a chain runs per column or per row"""
+    assert_modes_agree(column, [{"name": name, "parameters": PARAMETERS.get(name, {})}])
+
+
+def test_string_transformations_keep_nan_text():
+    """NaN is stringified like str() does instead of becoming empty"""
+    by_column, _, by_row = map_both_ways(pd.Series([np.nan, None], dtype=object), [{"name": "uppercase"}])
+    assert by_column == by_row == ["NAN", ""]
+
+
+def test_concat_keeps_nan_text():
+    """concat sees NaN as text in both modes"""
+    engine = MappingEngine()
+    df = pd.DataFrame({"first": ["Aung", np.nan, None], "last": ["Kyaw", "Min", "Htun"]})
+    concat = [{"name": "concat", "parameters": {"fields": ["first", "last"]}}]
+    by_column = engine.process_dataframe(df, {"full": {"source_column": "first", "transformations": concat}})
+    by_row = engine.process_dataframe(df, {"full": {"transformations": concat}})
+    assert by_column["full"].tolist() == by_row["full"].tolist() == ["Aung Kyaw", "nan Min", "Htun"]
+
+
+@pytest.mark.parametrize("name", list(DATE_VECTOR_OPS))
+@pytest.mark.parametrize("column", DATE_COLUMNS)
+def test_date_column_mode_matches_row_mode(name, column):
+    """Date transformations parse with the same format list in both modes"""
+    assert_modes_agree(column, [{"name": name}])
+
+
+def test_loose_dates_are_not_coerced():
+    """Partial dates and timestamps with a time are left as the scalar path leaves them"""
+    df = pd.DataFrame({"d": ["2020", "2020-01-01 10:00", None]})
+    mapping = {
+        name: {"source_column": "d", "transformations": [{"name": name}]}
+        for name in ("date_iso", "date_us", "extract_month", "extract_day")
+    }
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        out = MappingEngine().process_dataframe(df, mapping)
+    assert out["date_iso"].tolist() == ["2020", "2020-01-01 10:00", ""]
+    assert out["date_us"].tolist() == ["2020", "01/01/2020", "None"]
+    assert out["extract_month"].tolist() == [0, 1, 0]
+    assert out["extract_day"].tolist() == [0, 1, 0]
+
+
+def test_date_format_hits_count_rows():
+    """The column path counts a format once per row it parsed, like the scalar path"""
+    engine = MappingEngine()
+    df = pd.DataFrame({"d": ["01/02/2020", "01/02/2020", "Jan 05, 2020"]})
+    engine.process_dataframe(df, {"iso": {"source_column": "d", "transformations": [{"name": "date_iso"}]}})
+    assert engine.performance_stats["date_format_hits"] == {"%m/%d/%Y": 2, "%b %d, %Y": 1}
+
+
+@pytest.mark.parametrize("transformation", [
+    {"name": "to_float"},
+    {"name": "to_integer"},
+    {"name": "to_decimal"},
+    {"name": "percentage"},
+    {"name": "round_decimal", "parameters": {"decimals": 0}},
+    {"name": "round_decimal", "parameters": {"decimals": 2}},
+    {"name": "round_decimal", "parameters": {"decimals": 3}},
+    {"name": "erpnext_rate"},
+    {"name": "to_fixed_cents"},
+    {"name": "currency_format"},
+    {"name": "to_scaled_integer", "parameters": {"precision": 4}},
+])
+@pytest.mark.parametrize("column", NUMERIC_COLUMNS)
+def test_numeric_column_mode_matches_row_mode(transformation, column):
+    """Numeric kernels agree with the scalar conversions on inf, huge and unparseable values"""
+    assert_modes_agree(column, [transformation])
+
+
+def test_to_integer_keeps_values_beyond_int64():
+    """Values outside int64 convert like int(float(value)) instead of wrapping around"""
+    engine = MappingEngine()
+    df = pd.DataFrame({"n": [1e20, -1e20, 7.9]})
+    out = engine.process_dataframe(df, {"n": {"source_column": "n", "transformations": [{"name": "to_integer"}]}})
+    assert out["n"].tolist() == [engine._to_integer(value) for value in df["n"]] == [10**20, -10**20, 7]
+
+
+def test_to_float_keeps_infinity():
+    """inf stays inf, as float() leaves it"""
+    df = pd.DataFrame({"n": [float("inf"), "-inf", "1.5"]})
+    out = MappingEngine().process_dataframe(df, {"n": {"source_column": "n", "transformations": [{"name": "to_float"}]}})
+    assert out["n"].tolist() == [float("inf"), -float("inf"), 1.5]
+
+
+@pytest.mark.parametrize("name", [
+    "erpnext_territory", "erpnext_item_group", "erpnext_uom", "erpnext_payment_type", "erpnext_quantity", "lookup"
+])
+@pytest.mark.parametrize("column", ERPNEXT_COLUMNS)
+def test_erpnext_column_mode_matches_row_mode(name, column):
+    """ERPNext lookup tables and quantities agree with the scalar formatters"""
+    assert_modes_agree(column, [{"name": name, "parameters": PARAMETERS.get(name, {})}])
+
+
+def test_erpnext_formatters_on_nan():
+    """NaN is a truthy, non-numeric-looking value to the scalar formatters, in both modes"""
+    df = pd.DataFrame({"v": [np.nan, "nan"]})
+    mapping = {
+        name: {"source_column": "v", "transformations": [{"name": name}]}
+        for name in ("erpnext_quantity", "erpnext_uom", "erpnext_territory")
+    }
+    out = MappingEngine().process_dataframe(df, mapping)
+    assert out["erpnext_quantity"].tolist() == [0.0, 0.0]
+    assert out["erpnext_uom"].tolist() == ["Nan", "Nan"]
+    assert out["erpnext_territory"].tolist() == ["Nan", "Nan"]
+
+
+@pytest.mark.parametrize("condition", [
+    {"operator": "empty"},
+    {"operator": "not_empty"},
+    {"operator": "equals", "value": "nan"},
+    {"operator": "contains", "value": "a"},
+    {"operator": "greater_than", "value": "2"},
+    {"operator": "less_than", "value": "2"},
+])
+def test_conditional_column_mode_matches_row_mode(condition):
+    """Conditions see NaN, pd.NA and float()-only numbers the same way in both modes"""
+    engine = MappingEngine()
+    values = [None, np.nan, pd.NA, pd.NaT, "", "  ", "a", "nan", 0, -0.0, 1.5, " 3 ", "1_000", "1e400", True, False]
+    df = pd.DataFrame({"field": pd.Series(values, dtype=object), "other": "x"})
+    conditional = [{"name": "conditional", "parameters": {
+        "condition": {"field": "field", **condition}, "transformations": {"then": "T", "else": "E"}
+    }}]
+    by_column = engine.process_dataframe(df, {"out": {"source_column": "other", "transformations": conditional}})
+    by_row = engine.process_dataframe(df, {"out": {"transformations": conditional}})
+    assert by_column["out"].tolist() == by_row["out"].tolist()
+
+
+def test_conditional_empty_on_nan():
+    """NaN is the non-empty text 'nan' to the empty operators, None is empty"""
+    df = pd.DataFrame({"field": pd.Series([np.nan, None, ""], dtype=object)})
+    mapping = {
+        operator: {"source_column": "field", "transformations": [{"name": "conditional", "parameters": {
+            "condition": {"field": "field", "operator": operator}, "transformations": {"then": "T", "else": "E"}
+        }}]}
+        for operator in ("empty", "not_empty")
+    }
+    out = MappingEngine().process_dataframe(df, mapping)
+    assert out["empty"].tolist() == ["E", "T", "T"]
+    assert out["not_empty"].tolist() == ["T", "E", "E"]
+
+
+def test_repeated_dates_count_every_hit():
+    """A date seen again still counts its format, even when its parse is cached"""
+    engine = MappingEngine()
+    for _ in range(3):
+        assert engine._format_date_iso("01/02/2020") == "2020-01-02"
+    assert engine.performance_stats["date_format_hits"] == {"%m/%d/%Y": 3}
+
+
+def test_memoized_transforms_skip_nan():
+    """NaN is never cached, since no later lookup could hit it"""
+    engine = MappingEngine()
+    engine._format_erpnext_territory.cache_clear()
+    for _ in range(3):
+        engine._format_erpnext_territory(float("nan"))
+    assert engine._format_erpnext_territory.cache_info().currsize == 0
+
+
+def test_email_normalize_follows_strict_email():
+    """Turning strict_email on after an email was normalized applies the strict check to it"""
+    engine = MappingEngine()
+    assert engine._normalize_email("A!b@Example.com") == "a!b@example.com"
+    engine.strict_email = True
+    assert engine._normalize_email("A!b@Example.com") == ""
+    assert MappingEngine()._normalize_email("A!b@Example.com") == "a!b@example.com"
+
+
+def test_compiled_mapping_matches_process_dataframe():
+    """The generated runner maps a mixed spec exactly like process_dataframe"""
+    engine = MappingEngine()
+    df = pd.DataFrame({
+        "code": ["c-1", " c 2", None, "c-1"],
+        "name": ["aung", "MIN", np.nan, "htun"],
+        "amount": ["1.5", "x", None, 2.675],
+        "joined": ["01/02/2020", "2020-03-04", "bad", None],
+    })
+    mappings = {
+        "customer_code": {"source_column": "code", "transformations": [{"name": "erpnext_customer_code"}]},
+        "customer_name": {"source_column": "name", "transformations": [{"name": "trim"}, {"name": "title_case"}]},
+        "amount": {"source_column": "amount", "transformations": [{"name": "round_decimal", "parameters": {"decimals": 2}}]},
+        "joined": {"source_column": "joined", "transformations": [{"name": "date_iso"}]},
+        "label": {"transformations": [{"name": "concat", "parameters": {"fields": ["code", "name"]}}]},
+    }
+    compiled = engine.compile_mapping(mappings)(df)
+    expected = MappingEngine().process_dataframe(df, mappings)
+    assert list(compiled.columns) == list(expected.columns)
+    for column in expected.columns:
+        assert all(same_value(a, b) for a, b in zip(compiled[column].tolist(), expected[column].tolist())), column
+
+
+def test_compiled_mappings_keep_key_types_apart():
+    """Lookup tables keyed by 1 and by "1" compile to different runners"""
+    engine = MappingEngine()
+    df = pd.DataFrame({"v": ["1", "2"]})
+
+    def mapping(table):
+        return {"out": {"source_column": "v", "transformations": [
+            {"name": "lookup", "parameters": {"lookup_table": table, "default": "?"}}
+        ]}}
+
+    assert engine.compile_mapping(mapping({1: "one"}))(df)["out"].tolist() == ["?", "?"]
+    assert engine.compile_mapping(mapping({"1": "one"}))(df)["out"].tolist() == ["one", "?"]
+    mixed = mapping({1: "int", "2": "str"})
+    assert engine.compile_mapping(mixed)(df)["out"].tolist() == engine.process_dataframe(df, mixed)["out"].tolist()
+
+
+def test_compiled_mappings_are_bounded():
+    """Only the most recently used specs keep their runner"""
+    engine = MappingEngine()
+    specs = [{f"out{i}": {"source_column": "v", "transformations": [{"name": "trim"}]}} for i in range(200)]
+    runners = [engine.compile_mapping(spec) for spec in specs]
+    assert len(engine._compiled_mappings) == engine._compiled_mappings.maxsize
+    assert engine.compile_mapping(specs[-1]) is runners[-1]
+    assert engine.compile_mapping(specs[0]) is not runners[0]
+
+
+def test_scaled_integers_outside_int64_are_errors():
+    """Amounts too large for int64 units are reported instead of wrapping around"""
+    engine = MappingEngine()
+    df = pd.DataFrame({"amount": [1.25, 1e17, -1e17, "x"]})
+    out = engine.process_dataframe(df, {"cents": {"source_column": "amount", "transformations": [{"name": "to_fixed_cents"}]}})
+    assert out["cents"].tolist() == [125, 1e17, -1e17, 0]
+    assert [type(value) for value in out["cents"]] == [int, float, float, int]
+    assert engine.performance_stats["transformation_errors"] == 2
+    with pytest.raises(ValueError):
+        engine._to_fixed_cents(1e17)
+
+
+def _apply_mapping_config():
+    return {
+        "erp_endpoint": "Customer",
+        "target_columns": {
+            "customer_code": {"source_column": "code", "transformations": [{"name": "erpnext_customer_code"}]},
+            "amount": {"source_column": "amount", "transformations": [{"name": "to_float"}]},
+            "joined": {"source_column": "joined", "transformations": [{"name": "date_iso"}]},
+        },
+        "validation_rules": {"amount": {"required": True, "data_type": "numeric", "min_value": 0}},
+    }
+
+
+def _apply_mapping_frame(rows=400):
+    return pd.DataFrame({
+        "code": [f"c-{i % 37}" for i in range(rows)],
+        "amount": [(i % 11) - 2 for i in range(rows)],
+        "joined": ["01/02/2020" if i % 3 else "bad" for i in range(rows)],
+    })
+
+
+def test_parallel_mapping_matches_serial(monkeypatch):
+    """Worker processes return the same rows, errors and stats as one process"""
+    monkeypatch.setattr("app.utils.mapping_engine._PROCESS_MIN_ROWS", 100)
+    calls = []
+    split = MappingEngine._apply_mapping_parallel
+    monkeypatch.setattr(MappingEngine, "_apply_mapping_parallel", lambda *args: calls.append(1) or split(*args))
+    df = _apply_mapping_frame()
+    serial = MappingEngine().apply_mapping(df, _apply_mapping_config(), parallel=False)
+    parallel = MappingEngine().apply_mapping(df, _apply_mapping_config(), parallel=True, n_workers=3)
+    assert calls == [1]
+    assert parallel["mapped_data"] == serial["mapped_data"]
+    assert parallel["validation_errors"] == serial["validation_errors"]
+    for metadata in (serial, parallel):
+        metadata = metadata["processing_metadata"]
+        metadata.pop("processing_time_seconds")
+        for key in ("total_processing_time_ns", "average_processing_time"):
+            metadata["performance_stats"].pop(key)
+    assert parallel["processing_metadata"] == serial["processing_metadata"]
+
+
+def test_parallel_mapping_falls_back_for_unpicklable_engines(monkeypatch):
+    """A lambda custom transformation keeps the mapping in one process"""
+    monkeypatch.setattr("app.utils.mapping_engine._PROCESS_MIN_ROWS", 100)
+    engine = MappingEngine()
+    engine.register_custom_transformation("double", lambda value: value * 2)
+    config = _apply_mapping_config()
+    config["target_columns"]["amount"]["transformations"] = [{"name": "double"}]
+    result = engine.apply_mapping(_apply_mapping_frame(), config, parallel=True, n_workers=2)
+    assert result["processing_metadata"]["total_records_processed"] == 400
+
+
+def test_validation_plans_accept_mixed_rule_keys():
+    """Rules keyed by int and str fields no longer fail the plan lookup"""
+    config = _apply_mapping_config()
+    config["validation_rules"] = {1: {"required": True}, "amount": {"data_type": "numeric", "min_value": 0}}
+    result = MappingEngine().apply_mapping(_apply_mapping_frame(20), config, parallel=False)
+    assert result["processing_metadata"]["failed_records"] == 4
+
+
+def test_validation_plans_are_bounded():
+    """Plans are kept for the most recently used rule sets only"""
+    engine = MappingEngine()
+    df = _apply_mapping_frame(5)
+    for minimum in range(200):
+        config = _apply_mapping_config()
+        config["validation_rules"] = {"amount": {"min_value": minimum, "pattern": f"^{minimum}"}}
+        engine.apply_mapping(df, config, parallel=False)
+    assert len(engine._validation_plans) == engine._validation_plans.maxsize
+
+
+def test_currency_format_reads_text_like_float():
+    """Text float() accepts is formatted, other text becomes $0.00, as row by row"""
+    df = pd.DataFrame({"amount": ["1_000", "nan", "abc", 1234.5, None]})
+    mapping = {"amount": {"source_column": "amount", "transformations": [{"name": "currency_format"}]}}
+    out = MappingEngine().process_dataframe(df, mapping)
+    assert out["amount"].tolist() == ["$1,000.00", "$nan", "$0.00", "$1,234.50", "$0.00"]
+
+
+def test_date_parts_ignore_partial_dates():
+    """Year, month and day come from the scalar format list, not pandas' lenient parser"""
+    df = pd.DataFrame({"d": ["2020", "2020-01-02 10:00", "03/04/2021", None]})
+    mapping = {
+        name: {"source_column": "d", "transformations": [{"name": name}]}
+        for name in ("extract_year", "extract_month", "extract_day")
+    }
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", UserWarning)
+        out = MappingEngine().process_dataframe(df, mapping)
+    assert out["extract_year"].tolist() == [2020, 2020, 2021, 0]
+    assert out["extract_month"].tolist() == [0, 1, 3, 0]
+    assert out["extract_day"].tolist() == [0, 2, 4, 0]
+
+
+def test_apply_mapping_stays_in_process_by_default(monkeypatch):
+    """Worker processes are opt-in, whatever the frame size"""
+    monkeypatch.setattr("app.utils.mapping_engine._PROCESS_MIN_ROWS", 100)
+    monkeypatch.setattr(MappingEngine, "_apply_mapping_parallel", lambda *args: pytest.fail("parallel path taken"))
+    result = MappingEngine().apply_mapping(_apply_mapping_frame(), _apply_mapping_config(), n_workers=2)
+    assert result["processing_metadata"]["total_records_processed"] == 400
+
+
+def test_validate_mapping_config_keeps_key_types_apart():
+    """Configs differing only in int vs str field names are checked separately"""
+    engine = MappingEngine()
+    mapping = {"source_column": "a", "transformations": [{"name": "trim"}]}
+    int_fields = engine.validate_mapping_config({"target_columns": {1: mapping}, "validation_rules": {"1": {}}})
+    str_fields = engine.validate_mapping_config({"target_columns": {"1": mapping}, "validation_rules": {"1": {}}})
+    assert int_fields["warnings"] == ["Validation rules given for unmapped field '1'"]
+    assert str_fields == {"is_valid": True, "errors": [], "warnings": []}
+
+
+def test_validate_mapping_config_accepts_mixed_keys():
+    """Mixed int and str field names are reported on, not a TypeError"""
+    mapping = {"source_column": "a", "transformations": [{"name": "no_such_transformation"}]}
+    checked = MappingEngine().validate_mapping_config({"target_columns": {1: mapping, "b": mapping}})
+    assert checked["errors"] == [
+        "Unknown transformation 'no_such_transformation' for '1'",
+        "Unknown transformation 'no_such_transformation' for 'b'",
+    ]
+
+
+def test_validate_mapping_config_cache_is_bounded():
+    """Only the most recently checked configs are remembered"""
+    engine = MappingEngine()
+    for i in range(200):
+        engine.validate_mapping_config({"target_columns": {f"f{i}": {"source_column": "a"}}})
+    assert len(engine._config_checks) == engine._config_checks.maxsize
+
+
+def test_apply_mapping_iter_covers_the_frame_in_order():
+    """Row groups together give apply_mapping's rows and errors for the whole frame"""
+    df = _apply_mapping_frame(50)
+    whole = MappingEngine().apply_mapping(df, _apply_mapping_config())
+    groups = list(MappingEngine().apply_mapping_iter(df, _apply_mapping_config(), chunk_size=16))
+    assert [group["processing_metadata"]["total_records_processed"] for group in groups] == [16, 16, 16, 2]
+    assert [row for group in groups for row in group["mapped_data"]] == whole["mapped_data"]
+    assert [error for group in groups for error in group["validation_errors"]] == whole["validation_errors"]
+
+
+def test_apply_mapping_iter_rejects_empty_groups():
+    with pytest.raises(MappingError):
+        next(MappingEngine().apply_mapping_iter(_apply_mapping_frame(5), _apply_mapping_config(), chunk_size=0))
+
+
+def test_gpu_request_without_cudf_maps_on_the_cpu():
+    """use_gpu falls back to the CPU path when cuDF is not installed"""
+    df = _apply_mapping_frame(30)
+    on_cpu = MappingEngine().apply_mapping(df, _apply_mapping_config(), records=False)
+    requested = MappingEngine().apply_mapping(df, _apply_mapping_config(), records=False, use_gpu=True)
+    pd.testing.assert_frame_equal(requested["mapped_data"], on_cpu["mapped_data"])
+
+
+@pytest.mark.parametrize("data_type", ["customers", "items", "sales_orders"])
+def test_sample_mappings_are_valid_configs(data_type):
+    """Every template passes validate_mapping_config"""
+    engine = MappingEngine()
+    checked = engine.validate_mapping_config(engine.generate_sample_mapping(data_type))
+    assert checked["is_valid"], checked["errors"]
+
+
+def test_sample_mapping_is_a_fresh_copy():
+    """Editing a returned template leaves the next one untouched; unknown types get customers"""
+    engine = MappingEngine()
+    sample = engine.generate_sample_mapping("items")
+    sample["target_columns"].clear()
+    assert engine.generate_sample_mapping("items")["target_columns"]
+    assert engine.generate_sample_mapping("unknown") == engine.generate_sample_mapping("customers")
+
+
+@pytest.mark.parametrize("column", [
+    pd.Series([np.nan, np.nan]),
+    pd.Series([None, None], dtype=object),
+    pd.Series([None, pd.NA], dtype="string"),
+])
+def test_all_missing_columns_map(column):
+    """A column with no values, or no column at all, maps and validates without failing"""
+    df = pd.DataFrame({"flag": column, "when": column, "name": column})
+    config = {
+        "target_columns": {
+            "flag": {"source_column": "flag"},
+            "when": {"source_column": "when"},
+            "name": {"source_column": "name", "transformations": [{"name": "title_case"}]},
+            "absent": {"source_column": "absent"},
+        },
+        "validation_rules": {
+            "flag": {"data_type": "boolean"}, "when": {"data_type": "date"}, "absent": {"data_type": "date"}
+        },
+    }
+    result = MappingEngine().apply_mapping(df, config)
+    assert result["processing_metadata"]["total_records_processed"] == 2
+    assert MappingEngine().process_dataframe(df, {"name": config["target_columns"]["name"]})["name"].tolist() == \
+        [MappingEngine()._dispatch["title_case"](value) for value in column]
+
+
+def test_date_rule_accepts_mixed_formats():
+    """Dates in different formats each pass the date data_type rule, like the scalar check"""
+    df = pd.DataFrame({"d": ["Jan 05, 2020", "2020-01-02", "05/01/2020", "not a date"]})
+    config = {
+        "target_columns": {"d": {"source_column": "d"}},
+        "validation_rules": {"d": {"data_type": "date"}},
+    }
+    result = MappingEngine().apply_mapping(df, config)
+    assert [row["d"] for row in result["mapped_data"]] == ["Jan 05, 2020", "2020-01-02", "05/01/2020"]
+    assert [error["row_index"] for error in result["validation_errors"]] == [3]
+
+
+def test_lookup_keeps_table_values_as_they_are():
+    """None and int table values come out of a column lookup unchanged, as per row"""
+    column = pd.Series(["a", " b ", "c", "z", None, "a"], dtype=object)
+    transformations = [{"name": "lookup", "parameters": {"lookup_table": {"a": 1, "b": None, "c": 2}, "default": 0}}]
+    by_column, compiled, by_row = map_both_ways(column, transformations)
+    assert by_column == compiled == by_row == [1, None, 2, 0, 0, 1]
+    assert [type(value) for value in by_column] == [int, type(None), int, int, int, int]
+    assert_modes_agree(column, transformations)
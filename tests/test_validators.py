@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.utils.validators import (
+    CustomerValidator, ERPNextValidator, ItemValidator, ValidationSeverity, Validator,
+    validate_business_rules, validate_business_rules_batch
+)
+from app.utils.models import ERPNextEndpoint
+
+SCHEMA = {
+    "code": {"required": True, "erpnext_customer_code": True},
+    "name": {"not_empty": True, "min_length": {"value": 2}, "max_length": {"value": 10}},
+    "email": {"email": True},
+    "qty": {"numeric": True, "min_value": {"value": 0}, "erpnext_quantity": True},
+    "uom": {"erpnext_uom": True, "in_list": {"values": ["Nos", "Kg"]}},
+    "territory": {"erpnext_territory": True},
+}
+
+FRAME = pd.DataFrame({
+    "code": ["C-001", "c", None, "C 002", "C_003", np.nan],
+    "name": ["Aung", "", "A", "Min Min Min Min", None, "Htun"],
+    "email": ["a@b.com", "bad", None, "x@y", "", np.nan],
+    "qty": [1, -2, "3", "abc", None, np.nan],
+    "uom": ["Nos", "kg", "Box", None, "", np.nan],
+    "territory": ["Myanmar", "Mars", None, "", "myanmar ", np.nan],
+})
+
+
+def issues(result):
+    """Errors and warnings of a ValidationResult without their timestamps"""
+    return [
+        {key: value for key, value in issue.items() if key != "timestamp"}
+        for issue in (*result.errors, *result.warnings)
+    ]
+
+
+def test_validate_object_reuses_the_compiled_schema():
+    """A schema is compiled once, and again only after it changes in place"""
+    validator = Validator()
+    schema = {"name": {"required": True, "min_length": {"value": 3}}}
+    assert validator.schema_plan(schema) is validator.schema_plan(schema)
+    assert not validator.validate_object({"name": "ab"}, schema).is_valid
+    schema["name"]["min_length"]["value"] = 2
+    assert validator.validate_object({"name": "ab"}, schema).is_valid
+
+
+def test_register_rule_overrides_reach_compiled_schemas():
+    """Re-registering a rule replaces it in plans compiled before"""
+    validator = Validator()
+    schema = {"code": {"alphanumeric": True}}
+    assert not validator.validate_object({"code": "a-b"}, schema).is_valid
+    validator.register_rule("alphanumeric", lambda value: True, "Always valid", ValidationSeverity.ERROR)
+    assert validator.validate_object({"code": "a-b"}, schema).is_valid
+
+
+def test_customer_and_item_validators_see_rule_overrides():
+    """The customer, item and endpoint validators use rules registered after they were built"""
+    customers = CustomerValidator()
+    customer = {"customer_code": "C!", "customer_name": "Aung Kyaw"}
+    assert not customers.validate_customer(customer).is_valid
+    customers.validator.register_rule("erpnext_customer_code", lambda value: True, "Any code")
+    assert customers.validate_customer(customer).is_valid
+
+    items = ItemValidator()
+    item = {"item_code": "I!", "item_name": "Rice"}
+    assert not items.validate_item(item).is_valid
+    # The endpoint schema checks item codes as well, with its own registry
+    for validator in (items.validator, items.erpnext_validator.validator):
+        validator.register_rule("erpnext_item_code", lambda value: True, "Any code")
+    assert items.validate_item(item).is_valid
+
+    endpoints = ERPNextValidator()
+    assert not endpoints.validate_for_endpoint({"customer_name": "A"}, ERPNextEndpoint.CUSTOMERS).is_valid
+    endpoints.validator.register_rule("min_length", lambda value, minimum: True, "Any length")
+    assert endpoints.validate_for_endpoint({"customer_name": "A"}, ERPNextEndpoint.CUSTOMERS).is_valid
+
+
+def test_schema_plans_are_bounded():
+    """Fresh schema dicts per call do not grow the cache without limit"""
+    validator = Validator()
+    for i in range(300):
+        validator.validate_object({"name": "x"}, {"name": {"min_length": {"value": i % 5}}})
+    assert len(validator._plans) <= 128
+
+
+@pytest.mark.parametrize("missing_as_none", [True, False])
+def test_validate_frame_matches_validate_object(missing_as_none):
+    """Whole-column validation reports what validate_object reports row by row"""
+    validator = Validator()
+    frame_results = validator.validate_frame(FRAME, [SCHEMA], missing_as_none=missing_as_none)
+    for record, frame_result in zip(FRAME.to_dict("records"), frame_results):
+        if missing_as_none:
+            record = {field: None if pd.isna(value) else value for field, value in record.items()}
+        row_result = validator.validate_object(record, SCHEMA)
+        assert issues(frame_result) == issues(row_result), record
+        assert frame_result.is_valid == row_result.is_valid
+
+
+def test_validate_dataframe_summary():
+    """validate_dataframe splits rows into valid and invalid and counts their errors"""
+    results = Validator().validate_dataframe(FRAME, SCHEMA)
+    summary = results["summary"]
+    assert summary["total_rows"] == len(FRAME)
+    assert summary["valid_rows"] + summary["invalid_rows"] == len(FRAME)
+    assert [row["row_index"] for row in results["valid_rows"]] == [0]
+    assert summary["total_errors"] == len(results["validation_errors"]) > 0
+
+
+def test_validate_business_rules_batch_matches_per_record():
+    """The batch validator returns exactly the per-record results"""
+    business_rules = {
+        "required_fields": ["code"],
+        "value_constraints": {
+            "qty": {"min": 0, "max": 100},
+            "rate": {"min": 0.5},
+            "uom": {"allowed_values": ["Nos", "Kg"]},
+        },
+    }
+    records = [
+        {"code": "C1", "qty": 5, "rate": 1.0, "uom": "Nos"},
+        {"code": "", "qty": -1, "rate": 0.1, "uom": "Box"},
+        {"code": "C3", "qty": "12", "rate": "abc", "uom": "Kg"},
+        {"code": "C4", "qty": None, "rate": float("nan"), "uom": None},
+        {"code": "C5", "qty": 1e9, "uom": "Nos"},
+        {"qty": "", "rate": True, "uom": "Kg"},
+    ]
+    expected = [validate_business_rules(record, business_rules) for record in records]
+    assert validate_business_rules_batch(records, business_rules) == expected
+    assert [result["is_valid"] for result in expected] == [True, False, False, True, False, False]
+
+
+def test_business_rules_reject_nan_text():
+    """'nan' reads as a float but is not a number a bound can check"""
+    business_rules = {"value_constraints": {"qty": {"min": 0, "max": 100}}}
+    records = [{"qty": "nan"}, {"qty": "NaN"}, {"qty": 5}]
+    results = validate_business_rules_batch(records, business_rules)
+    assert results == [validate_business_rules(record, business_rules) for record in records]
+    assert [result["is_valid"] for result in results] == [False, False, True]
+    assert results[0]["errors"] == ["Field 'qty' value 'nan' is not a number"]
+
+
+def test_business_rules_coerce_bounds():
+    """Bounds given as text are compared as numbers; bounds that are not numbers are reported"""
+    records = [{"qty": 5}, {"qty": -1}, {"qty": ""}]
+    business_rules = {"value_constraints": {"qty": {"min": "0", "max": "10"}}}
+    results = validate_business_rules_batch(records, business_rules)
+    assert results == [validate_business_rules(record, business_rules) for record in records]
+    assert [result["is_valid"] for result in results] == [True, False, True]
+    assert results[1]["errors"] == ["Field 'qty' value -1 is below minimum 0"]
+    
+    business_rules = {"value_constraints": {"qty": {"min": "zero"}}}
+    results = validate_business_rules_batch(records, business_rules)
+    assert results == [validate_business_rules(record, business_rules) for record in records]
+    assert results[0]["errors"] == ["Field 'qty' has an invalid constraint: min bound 'zero' is not a number"]